@@ -1,22 +1,43 @@
 #!/usr/bin/env python3
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Plots are only written to files; skip GUI backend setup
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+import matplotlib.image as mpimg
 import re
 import os
+import mmap
 import glob
 import numpy as np
 import json
 import argparse
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from dataclasses import dataclass
 
 try:
-    from windrose import WindroseAxes
-    windrose_installed = True
+    import orjson
+    orjson_installed = True
 except ImportError:
-    windrose_installed = False
+    orjson_installed = False
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    pyarrow_installed = True
+except ImportError:
+    pyarrow_installed = False
+
+try:
+    import polars as pl
+    polars_installed = True
+except ImportError:
+    polars_installed = False
 
 # Maps the short column names to a full description and unit for plotting.
 PLOT_METADATA = {
@@ -39,75 +60,327 @@ PLOT_METADATA = {
     'TD': ('True Heading', 'Direction (°)')
 }
 
+plt.style.use('default')
+
+# CSV logs larger than this are streamed in chunks instead of loaded whole
+STREAMING_THRESHOLD_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 500_000
+PLOT_ROWS_PER_CHUNK = 10_000
+
+# Output resolution for PNG plots; pixels rendered grow with dpi squared
+DEFAULT_DPI = 120
+
+# Wind rose speed classes (m/s) and number of compass sectors
+WIND_ROSE_SPEED_BINS = np.array([0, 1, 2, 3, 5, 7, 10, 15, np.inf])
+WIND_ROSE_SECTORS = 16
+
+# PNG encoding and disk writes run here so the next plot can be drawn meanwhile
+_SAVE_POOL = ThreadPoolExecutor(max_workers=4)
+_pending_saves = []
+
+# Size of each time-series plot (inches) and the most pixels rendered in one figure
+TIME_SERIES_FIGSIZE = (15, 8)
+MAX_RENDER_PIXELS = 32_000_000
+
+# Upper bound on samples drawn per line; statistics always use the full series
+MAX_PLOT_POINTS = 5000
+
+# Tagged log lines look like "[<timestamp>] ,S 01.23,D 180,..."
+_TAGGED_HEAD_RE = re.compile(r'\[(.*?)\]\s*,')
+# Byte patterns so tagged files can be scanned straight out of a memory map
+_TAGGED_LINE_RE = re.compile(rb'^\[(?P<ts>[^\]\n]*)\][ \t]*,(?P<body>[^\n]*)$', re.MULTILINE)
+_TAGGED_PAIR_RE = re.compile(rb'([^\s,]+)[ \t]+([^\s,]+)')
+
+# Detected formats persist in the user's cache directory between runs, keyed by path, mtime and size
+FORMAT_CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'trisonica', 'format_cache.json')
+_format_cache = None
+
+def _load_format_cache():
+    """Loads the on-disk format cache once per process."""
+    global _format_cache
+    if _format_cache is None:
+        try:
+            with open(FORMAT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                _format_cache = json.load(f)
+        except (OSError, ValueError):
+            _format_cache = {}
+    return _format_cache
+
+def save_format_cache():
+    """Writes the format cache sidecar; failures only cost a re-detect next run."""
+    if not _format_cache:
+        return
+    try:
+        os.makedirs(os.path.dirname(FORMAT_CACHE_FILE), exist_ok=True)
+        tmp_path = FORMAT_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(_format_cache, f)
+        os.replace(tmp_path, FORMAT_CACHE_FILE)
+    except OSError as e:
+        print(f"[INFO] Could not save format cache: {e}")
+
 def detect_log_format(file_path):
     """
     Detects the format of the log file (old tagged format vs new CSV format).
+    Results are cached by (path, mtime, size) so unchanged files are not reopened.
     """
+    path = os.path.abspath(file_path)
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline().strip()
-            second_line = f.readline().strip()
-            
-        # Check if it's new CSV format (header line)
-        if ',' in first_line and ('Time' in first_line or 'timestamp' in first_line):
-            return 'csv'
+        st = os.stat(path)
+        return _detect_log_format_cached(path, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        # Raised before either cache stores anything, so an unreadable file is retried next time
+        print(f"Error detecting format for {file_path}: {e}")
+        return 'unknown'
+
+@functools.lru_cache(maxsize=4096)
+def _detect_log_format_cached(path, mtime_ns, size):
+    cache = _load_format_cache()
+    entry = cache.get(path)
+    if entry and entry[0] == mtime_ns and entry[1] == size:
+        return entry[2]
+    
+    log_format = _sniff_log_format(path)
+    cache[path] = [mtime_ns, size, log_format]
+    return log_format
+
+def _sniff_log_format(file_path):
+    """Classifies a log from its first two lines; read errors propagate to the caller."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        first_line = f.readline().strip()
+        second_line = f.readline().strip()
+        
+    # Check if it's new CSV format (header line)
+    if ',' in first_line and ('Time' in first_line or 'timestamp' in first_line):
+        return 'csv'
+    
+    # Check if it's old tagged format
+    if _TAGGED_HEAD_RE.match(first_line) or _TAGGED_HEAD_RE.match(second_line):
+        return 'tagged'
         
-        # Check if it's old tagged format
-        if re.match(r'\[(.*?)\]\s*,', first_line) or re.match(r'\[(.*?)\]\s*,', second_line):
-            return 'tagged'
+    # Check if it's macOS JSON format
+    if 'parsed_json' in first_line:
+        return 'json'
+        
+    return 'unknown'
+
+def _read_csv_frame(file_path):
+    """
+    Reads a CSV file into a DataFrame, using PyArrow's multithreaded typed reader when available.
+    """
+    if pyarrow_installed:
+        try:
+            return pacsv.read_csv(file_path).to_pandas()
+        except pa.ArrowInvalid:
+            # Type inference failed part-way through (e.g. a stray text value); let pandas handle it
+            pass
+    return pd.read_csv(file_path)
+
+def _find_timestamp_column(columns):
+    """
+    Returns the name of the timestamp column, handling the different names used by the loggers.
+    """
+    for col in ['Time', 'timestamp', 'Timestamp']:
+        if col in columns:
+            return col
+    return None
+
+def _clean_csv_frame(df, timestamp_col, verbose=True):
+    """
+    Converts types, filters error values and indexes a raw CSV frame by its timestamp column.
+    """
+    df[timestamp_col] = pd.to_datetime(df[timestamp_col], errors='coerce')
+    df.dropna(subset=[timestamp_col], inplace=True)
+    
+    # Convert numeric columns (columns the reader already typed are left alone)
+    for col in df.columns:
+        if col != timestamp_col and not pd.api.types.is_numeric_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    
+    # Filter out error values (-99.50) from wind speed columns in a single masked pass
+    wind_speed_cols = [col for col in ('S', 'S2', 'S3') if col in df.columns]
+    if wind_speed_cols:
+        error_mask = df[wind_speed_cols].eq(-99.50)
+        df[wind_speed_cols] = df[wind_speed_cols].mask(error_mask)
+        if verbose:
+            for col, count in error_mask.sum().items():
+                print(f"    [INFO] Filtered {count} error values (-99.50) from column '{col}'")
             
-        # Check if it's macOS JSON format
-        if 'parsed_json' in first_line:
-            return 'json'
+    df.set_index(timestamp_col, inplace=True)
+    return df
+
+def _parse_csv_polars(file_path):
+    """
+    Parses a CSV log with Polars and computes per-column statistics on the Polars side.
+    Returns (DataFrame, column_stats); conversion to pandas only happens at the end, for plotting.
+    """
+    # Read every column as text and cast below, so a stray value anywhere in the file
+    # becomes null (like pandas' errors='coerce') instead of failing the whole read
+    pl_df = pl.read_csv(file_path, infer_schema_length=0)
+    
+    timestamp_col = _find_timestamp_column(pl_df.columns)
+    if timestamp_col is None:
+        print(f"[ERROR] No timestamp column found in {file_path}")
+        return None, {}
+        
+    timestamp_expr = pl.col(timestamp_col)
+    if pl_df.schema[timestamp_col] == pl.String:
+        timestamp_expr = timestamp_expr.str.to_datetime(strict=False)
+    value_cols = [col for col in pl_df.columns if col != timestamp_col]
+    
+    pl_df = pl_df.with_columns(timestamp_expr, pl.col(value_cols).cast(pl.Float64, strict=False))
+    pl_df = pl_df.drop_nulls(subset=[timestamp_col])
+    
+    # Filter out error values (-99.50) from wind speed columns
+    wind_speed_cols = [col for col in ('S', 'S2', 'S3') if col in value_cols]
+    if wind_speed_cols:
+        error_counts = pl_df.select((pl.col(wind_speed_cols) == -99.50).sum()).row(0, named=True)
+        pl_df = pl_df.with_columns(
+            pl.when(pl.col(col) == -99.50).then(None).otherwise(pl.col(col)).alias(col)
+            for col in wind_speed_cols
+        )
+        for col, count in error_counts.items():
+            print(f"    [INFO] Filtered {count} error values (-99.50) from column '{col}'")
             
-        return 'unknown'
+    # All column statistics in one multithreaded select
+    stat_exprs = {
+        'count': pl.col(value_cols).count(),
+        'min': pl.col(value_cols).min(),
+        'max': pl.col(value_cols).max(),
+        'mean': pl.col(value_cols).mean(),
+        'std': pl.col(value_cols).std()
+    }
+    stats_row = pl_df.select(
+        expr.name.suffix(f'__{name}') for name, expr in stat_exprs.items()
+    ).row(0, named=True)
+    # Polars reports undefined statistics (e.g. std of one value) as null
+    column_stats = {
+        col: {name: np.nan if stats_row[f'{col}__{name}'] is None else stats_row[f'{col}__{name}']
+              for name in stat_exprs}
+        for col in value_cols
+    }
+    
+    df = pl_df.to_pandas()
+    df.set_index(timestamp_col, inplace=True)
+    return df, column_stats
+
+def parse_csv_log_with_stats(file_path):
+    """
+    Parses a CSV log file, also returning per-column statistics when Polars computed them.
+    """
+    if not polars_installed:
+        return parse_csv_log(file_path), {}
         
+    print(f"[INFO] Processing CSV file: {os.path.basename(file_path)}")
+    try:
+        return _parse_csv_polars(file_path)
     except Exception as e:
-        print(f"Error detecting format for {file_path}: {e}")
-        return 'unknown'
+        print(f"[ERROR] Error processing CSV {file_path}: {e}")
+        return None, {}
 
 def parse_csv_log(file_path):
     """
     Parses a CSV log file (new format).
     """
+    if polars_installed:
+        return parse_csv_log_with_stats(file_path)[0]
+        
     print(f"[INFO] Processing CSV file: {os.path.basename(file_path)}")
     
     try:
-        df = pd.read_csv(file_path)
+        df = _read_csv_frame(file_path)
         
-        # Handle different timestamp column names
-        timestamp_col = None
-        for col in ['Time', 'timestamp', 'Timestamp']:
-            if col in df.columns:
-                timestamp_col = col
-                break
-                
+        timestamp_col = _find_timestamp_column(df.columns)
         if timestamp_col is None:
             print(f"[ERROR] No timestamp column found in {file_path}")
             return None
             
-        df[timestamp_col] = pd.to_datetime(df[timestamp_col], errors='coerce')
-        df.dropna(subset=[timestamp_col], inplace=True)
-        
-        # Convert numeric columns
-        for col in df.columns:
-            if col != timestamp_col:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-        
-        # Filter out error values (-99.50) from wind speed columns
-        wind_speed_cols = ['S', 'S2', 'S3']
-        for col in wind_speed_cols:
-            if col in df.columns:
-                df.loc[df[col] == -99.50, col] = pd.NA
-                print(f"    [INFO] Filtered {(df[col] == -99.50).sum()} error values (-99.50) from column '{col}'")
-                
-        df.set_index(timestamp_col, inplace=True)
-        return df
+        return _clean_csv_frame(df, timestamp_col)
         
     except Exception as e:
         print(f"[ERROR] Error processing CSV {file_path}: {e}")
         return None
 
+@dataclass
+class RunningStats:
+    """
+    Running count/min/max/mean/std of one column, merged chunk by chunk (parallel Welford update).
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = np.inf
+    max: float = -np.inf
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+        chunk_mean = values.mean()
+        chunk_m2 = np.square(values - chunk_mean).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta * delta * self.count * n / total
+        self.count = total
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+
+    def as_dict(self):
+        std = (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else np.nan
+        return {'count': self.count, 'min': self.min, 'max': self.max, 'mean': self.mean, 'std': std}
+
+def stream_csv_log(file_path, chunksize=CSV_CHUNK_ROWS):
+    """
+    Streams a large CSV log in chunks so memory stays bounded regardless of file size.
+    Returns a decimated DataFrame for plotting plus full-resolution statistics per column.
+    """
+    print(f"[INFO] Streaming CSV file: {os.path.basename(file_path)}")
+    
+    column_stats = {}
+    plot_chunks = []
+    total_rows = 0
+    try:
+        for chunk in pd.read_csv(file_path, chunksize=chunksize):
+            timestamp_col = _find_timestamp_column(chunk.columns)
+            if timestamp_col is None:
+                print(f"[ERROR] No timestamp column found in {file_path}")
+                return None, {}
+                
+            chunk = _clean_csv_frame(chunk, timestamp_col, verbose=False)
+            total_rows += len(chunk)
+            for col in chunk.columns:
+                values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+                column_stats.setdefault(col, RunningStats()).update(values)
+                
+            # Keep roughly PLOT_ROWS_PER_CHUNK evenly spaced rows of every chunk for plotting
+            step = max(1, len(chunk) // PLOT_ROWS_PER_CHUNK)
+            plot_chunks.append(chunk.iloc[::step])
+            
+    except Exception as e:
+        print(f"[ERROR] Error streaming CSV {file_path}: {e}")
+        return None, {}
+        
+    if not plot_chunks or total_rows == 0:
+        print(f"[WARNING] No valid data found in {file_path}")
+        return None, {}
+        
+    plot_df = pd.concat(plot_chunks)
+    print(f"[INFO] Streamed {total_rows} rows, keeping {len(plot_df)} rows for plotting")
+    return plot_df, {col: stats.as_dict() for col, stats in column_stats.items()}
+
+def _loads_json_record(text):
+    """
+    Decodes a single parsed_json cell, returning None if it is not a valid JSON object.
+    """
+    try:
+        record = orjson.loads(text) if orjson_installed else json.loads(text)
+    except (ValueError, TypeError):
+        return None
+    return record if isinstance(record, dict) else None
+
 def parse_json_log(file_path):
     """
     Parses a JSON log file (macOS format with parsed_json column).
@@ -124,28 +397,32 @@ def parse_json_log(file_path):
         df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
         df.dropna(subset=['timestamp'], inplace=True)
         
-        # Parse JSON data
-        parsed_data = []
-        for idx, row in df.iterrows():
-            try:
-                json_data = json.loads(row['parsed_json'])
-                row_data = {'timestamp': row['timestamp']}
-                for key, value in json_data.items():
-                    try:
-                        row_data[key] = float(value)
-                    except (ValueError, TypeError):
-                        row_data[key] = value
-                parsed_data.append(row_data)
-            except (json.JSONDecodeError, KeyError):
-                continue
+        # Decode all JSON payloads in one pass; malformed rows come back as None
+        decoded = [_loads_json_record(text) for text in df['parsed_json'].tolist()]
+        valid = np.array([record is not None for record in decoded], dtype=bool)
+        records = [record for record in decoded if record is not None]
                 
-        if not parsed_data:
+        if not records:
             print(f"[WARNING] No valid JSON data found in {file_path}")
             return None
             
-        df = pd.DataFrame(parsed_data)
-        df.set_index('timestamp', inplace=True)
-        return df
+        # Extract only the known Trisonica parameters, in PLOT_METADATA order, as
+        # fixed-width tuples; pandas then builds float columns directly
+        present = set().union(*records)
+        keys = [key for key in PLOT_METADATA if key in present]
+        if not keys:
+            print(f"[WARNING] No known Trisonica parameters in {file_path}")
+            return None
+            
+        rows = [tuple(record.get(key, np.nan) for key in keys) for record in records]
+        df_out = pd.DataFrame.from_records(rows, columns=keys)
+        for col in df_out.columns:
+            if not pd.api.types.is_numeric_dtype(df_out[col]):
+                df_out[col] = pd.to_numeric(df_out[col], errors='coerce')
+        # Float columns throughout, as when every value went through float()
+        df_out = df_out.astype(np.float64)
+        df_out.index = pd.DatetimeIndex(df['timestamp'].to_numpy()[valid], name='timestamp')
+        return df_out
         
     except Exception as e:
         print(f"[ERROR] Error processing JSON {file_path}: {e}")
@@ -157,34 +434,39 @@ def parse_tagged_log(file_path):
     """
     print(f"[INFO] Processing tagged file: {os.path.basename(file_path)}")
     
-    parsed_data = []
+    timestamps = []
+    rows = []
+    columns = {}  # Insertion-ordered union of keys, mapped to their column index
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if "Mode" in line and "overriding" in line:
-                    continue
-                match = re.match(r'\[(.*?)\]\s*,(.*)', line)
-                if not match:
-                    continue
-                timestamp_str, data_str = match.groups()
-                row_data = {'Timestamp': timestamp_str}
-                pairs = data_str.strip().split(',')
-                for pair in pairs:
-                    parts = re.split(r'\s+', pair.strip(), maxsplit=1)
-                    if len(parts) == 2:
-                        key, value = parts
-                        row_data[key] = value
-                parsed_data.append(row_data)
-
-        if not parsed_data:
+        if os.path.getsize(file_path) > 0:  # mmap cannot map an empty file
+            with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for match in _TAGGED_LINE_RE.finditer(mm):
+                    line = match.group(0)
+                    if b"Mode" in line and b"overriding" in line:
+                        continue
+                    pairs = _TAGGED_PAIR_RE.findall(match.group('body'))
+                    for key, _ in pairs:
+                        if key not in columns:
+                            columns[key] = len(columns)
+                    timestamps.append(match.group('ts').decode('ascii', 'replace'))
+                    rows.append(pairs)
+
+        if not rows:
             print(f"[WARNING] No valid data found in {file_path}")
             return None
 
-        df = pd.DataFrame(parsed_data)
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
+        # Write values straight into a preallocated 2D array instead of building per-row dicts
+        values = np.full((len(rows), len(columns)), np.nan)
+        for i, pairs in enumerate(rows):
+            for key, value in pairs:
+                try:
+                    values[i, columns[key]] = float(value)
+                except ValueError:
+                    pass  # Non-numeric readings stay NaN, as with pd.to_numeric(errors='coerce')
+
+        df = pd.DataFrame(values, columns=[key.decode('ascii', 'replace') for key in columns])
+        df['Timestamp'] = pd.to_datetime(timestamps, errors='coerce')
         df.dropna(subset=['Timestamp'], inplace=True)
-        for col in df.columns.drop('Timestamp'):
-            df[col] = pd.to_numeric(df[col], errors='coerce')
         df.set_index('Timestamp', inplace=True)
         return df
 
@@ -208,112 +490,232 @@ def parse_trisonica_log(file_path):
         print(f"[ERROR] Unknown format for {file_path}")
         return None
 
-def save_time_series_plot(df, y_column, title, y_label, output_filename):
+def _decimate(times, values, max_points=MAX_PLOT_POINTS):
     """
-    Generates and saves a time-series plot for any variable.
+    Returns every Nth (time, value) pair so that at most about max_points are handed to matplotlib.
     """
-    if df is None or y_column not in df.columns or df[y_column].isnull().all():
-        print(f"    [SKIP] '{title}' plot (no data).")
-        return
-        
-    print(f"    [PLOT] Generating '{title}' plot...")
-    
-    plt.style.use('default')
-    fig, ax = plt.subplots(figsize=(15, 8))
-    
-    # Plot with different styles based on data density
-    data_points = len(df[y_column].dropna())
+    stride = max(1, len(values) // max_points)
+    return times[::stride], values[::stride]
+
+def _array_stats(values):
+    """
+    Computes count/min/max/mean/std of a float array, ignoring NaNs.
+    """
+    valid = ~np.isnan(values)
+    count = int(np.count_nonzero(valid))
+    if count == 0:
+        return {'count': 0}
+    # Only copy out the valid samples when there actually are gaps
+    finite = values if count == len(values) else values[valid]
+    return {
+        'count': count,
+        'min': float(finite.min()),
+        'max': float(finite.max()),
+        'mean': float(finite.mean(dtype=np.float64)),
+        'std': float(finite.std(dtype=np.float64, ddof=1)) if count > 1 else np.nan
+    }
+
+def to_plot_arrays(df):
+    """
+    Converts a parsed DataFrame into a datetime64 time array plus one contiguous
+    float32 array per column (structure of arrays), which is all the plots need.
+    """
+    times = df.index.values.astype('datetime64[ns]')
+    arrays = {col: df[col].to_numpy(dtype=np.float32, na_value=np.nan) for col in df.columns}
+    return times, arrays
+
+def _save_figure_async(fig, output_filename, dpi):
+    """
+    Renders the figure on the calling thread and queues the PNG encode and write
+    on _SAVE_POOL. The pixel buffer is copied, so the figure can be reused or closed right away.
+    """
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    rgba = np.asarray(fig.canvas.buffer_rgba()).copy()
+    _pending_saves.append(_SAVE_POOL.submit(mpimg.imsave, output_filename, rgba, dpi=dpi))
+
+def wait_for_saves():
+    """Blocks until all queued PNG writes have finished, re-raising any write error."""
+    while _pending_saves:
+        _pending_saves.pop(0).result()
+
+def set_save_threads(count):
+    """
+    Replaces _SAVE_POOL with one of count threads. Also the worker initializer, so
+    parallel file workers split the CPUs between them instead of each starting a full pool.
+    """
+    global _SAVE_POOL
+    wait_for_saves()
+    _SAVE_POOL.shutdown()
+    _SAVE_POOL = ThreadPoolExecutor(max_workers=count)
+
+def _date_formatter(times):
+    """Picks a date format for the x-axis based on how long the series spans."""
+    if times.size == 0:
+        return mdates.DateFormatter('%H:%M:%S')
+    duration = (times.max() - times.min()) / np.timedelta64(1, 's')
+    if duration < 3600:  # Less than 1 hour
+        return mdates.DateFormatter('%H:%M:%S')
+    elif duration < 86400:  # Less than 1 day
+        return mdates.DateFormatter('%H:%M')
+    else:  # More than 1 day
+        return mdates.DateFormatter('%m/%d %H:%M')
+
+def _draw_time_series(ax, times, values, title, y_label, stats, formatter):
+    """
+    Draws one time-series panel with its statistics box onto ax.
+    """
+    # Plot with different styles based on data density; long series are
+    # decimated since the rendered line cannot show more points than pixels
+    data_points = stats['count']
+    plot_times, plot_values = _decimate(times, values)
     if data_points > 1000:
-        ax.plot(df.index, df[y_column], linestyle='-', linewidth=0.8, alpha=0.7)
+        ax.plot(plot_times, plot_values, linestyle='-', linewidth=0.8, alpha=0.7, rasterized=True)
     else:
-        ax.plot(df.index, df[y_column], marker='o', linestyle='-', markersize=3, linewidth=1)
+        ax.plot(plot_times, plot_values, marker='o', linestyle='-', markersize=3, linewidth=1, rasterized=True)
     
     ax.set_title(title, fontsize=16, fontweight='bold')
     ax.set_xlabel("Time (UTC)", fontsize=12)
     ax.set_ylabel(y_label, fontsize=12)
-    
-    # Format x-axis based on data duration
-    duration = df.index.max() - df.index.min()
-    if duration.total_seconds() < 3600:  # Less than 1 hour
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-    elif duration.total_seconds() < 86400:  # Less than 1 day
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    else:  # More than 1 day
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
+    ax.xaxis.set_major_formatter(formatter)
     
     # Add grid and statistics
     ax.grid(True, alpha=0.3)
     
     # Add statistics text box
     stats_text = f'Points: {data_points}\n'
-    if not df[y_column].isnull().all():
-        stats_text += f'Min: {df[y_column].min():.2f}\n'
-        stats_text += f'Max: {df[y_column].max():.2f}\n'
-        stats_text += f'Mean: {df[y_column].mean():.2f}\n'
-        stats_text += f'Std: {df[y_column].std():.2f}'
+    if data_points > 0:
+        stats_text += f'Min: {stats["min"]:.2f}\n'
+        stats_text += f'Max: {stats["max"]:.2f}\n'
+        stats_text += f'Mean: {stats["mean"]:.2f}\n'
+        stats_text += f'Std: {stats["std"]:.2f}'
     
     ax.text(0.02, 0.98, stats_text, transform=ax.transAxes, fontsize=10,
             verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
-    fig.autofmt_xdate()
-    plt.tight_layout()
+    # Rotated date labels instead of autofmt_xdate, which runs an extra layout pass
+    plt.setp(ax.get_xticklabels(), rotation=30, ha='right')
+
+def save_time_series_plots(times, series, dpi=DEFAULT_DPI):
+    """
+    Generates one time-series PNG per entry of series, a list of
+    (values, title, y_label, output_filename, stats) tuples sharing the same times.
+    All panels are stacked in one figure with a shared date axis and rendered in a
+    single pass; each PNG is then cropped out of the rendered pixel buffer.
+    """
+    panels = []
+    for values, title, y_label, output_filename, stats in series:
+        if stats is None:
+            stats = _array_stats(values)
+        if stats['count'] == 0:
+            print(f"    [SKIP] '{title}' plot (no data).")
+            continue
+        print(f"    [PLOT] Generating '{title}' plot...")
+        panels.append((values, title, y_label, output_filename, stats))
+    
+    if not panels:
+        return
+    
+    formatter = _date_formatter(times)
+    # Cap the pixels rendered at once so high dpi settings do not exhaust memory
+    panel_pixels = TIME_SERIES_FIGSIZE[0] * TIME_SERIES_FIGSIZE[1] * dpi * dpi
+    panels_per_figure = max(1, int(MAX_RENDER_PIXELS // panel_pixels))
     
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
-    plt.close(fig)
+    for first in range(0, len(panels), panels_per_figure):
+        batch = panels[first:first + panels_per_figure]
+        n = len(batch)
+        width, height = TIME_SERIES_FIGSIZE
+        fig = plt.figure(figsize=(width, height * n), dpi=dpi)
+        
+        shared_ax = None
+        for i, (values, title, y_label, _, stats) in enumerate(batch):
+            # Same margins as a standalone plot, within the i-th slot from the top
+            slot_bottom = (n - 1 - i) / n
+            ax = fig.add_axes([0.06, slot_bottom + 0.14 / n, 0.92, 0.80 / n], sharex=shared_ax)
+            shared_ax = shared_ax or ax
+            _draw_time_series(ax, times, values, title, y_label, stats, formatter)
+        
+        fig.canvas.draw()
+        rgba = np.asarray(fig.canvas.buffer_rgba())
+        slot_pixels = rgba.shape[0] // n
+        for i, (_, _, _, output_filename, _) in enumerate(batch):
+            panel = rgba[i * slot_pixels:(i + 1) * slot_pixels].copy()
+            _pending_saves.append(_SAVE_POOL.submit(mpimg.imsave, output_filename, panel, dpi=dpi))
+        plt.close(fig)
 
-def save_wind_rose_plot(df, speed_col, dir_col, output_filename):
+def _wind_rose_counts(speed, direction):
+    """
+    Counts samples per speed class (rows, WIND_ROSE_SPEED_BINS) and direction sector (columns).
+    """
+    # Shift by half a sector so the first direction bin is centred on north
+    sector_width = 360 / WIND_ROSE_SECTORS
+    shifted_direction = (direction + sector_width / 2) % 360
+    counts, _, _ = np.histogram2d(speed, shifted_direction,
+                                  bins=[WIND_ROSE_SPEED_BINS, np.linspace(0, 360, WIND_ROSE_SECTORS + 1)])
+    return counts
+
+def save_wind_rose_plot(df, speed_col, dir_col, output_filename, dpi=DEFAULT_DPI):
     """
     Generates and saves a wind rose plot.
+    Samples are binned once with np.histogram2d and drawn as one stacked bar call per speed class.
     """
-    if not windrose_installed:
-        print("    [SKIP] Wind rose plot (windrose not installed).")
-        return 
-        
     if df is None or speed_col not in df.columns or dir_col not in df.columns:
         print("    [SKIP] Wind rose plot (missing data).")
         return
 
-    # Check for valid data
-    speed_data = df[speed_col].dropna()
-    dir_data = df[dir_col].dropna()
+    speed = df[speed_col].to_numpy(dtype=np.float64, na_value=np.nan)
+    direction = df[dir_col].to_numpy(dtype=np.float64, na_value=np.nan)
     
-    if len(speed_data) == 0 or len(dir_data) == 0:
-        print("    [SKIP] Wind rose plot (no valid data).")
+    # Filter out missing/invalid wind directions and speeds (including -99.50 error values)
+    valid = (direction >= 0) & (direction <= 360) & (speed >= 0) & (speed != -99.50)
+    if not valid.any():
+        print("    [SKIP] Wind rose plot (no valid wind data).")
         return
+        
+    speed = speed[valid]
+    direction = direction[valid]
 
     print("    [PLOT] Generating Wind Rose plot...")
     
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='windrose')
-    
-    # Filter out invalid wind directions and speeds (including -99.50 error values)
-    valid_idx = (df[dir_col] >= 0) & (df[dir_col] <= 360) & (df[speed_col] >= 0) & (df[speed_col] != -99.50)
-    if not valid_idx.any():
-        print("    [SKIP] Wind rose plot (no valid wind data).")
-        plt.close(fig)
-        return
-    
-    valid_df = df[valid_idx]
-    
-    ax.bar(valid_df[dir_col], valid_df[speed_col], normed=True, opening=0.8, 
-           edgecolor='white', bins=8)
+    sector_width = 360 / WIND_ROSE_SECTORS
+    frequency = _wind_rose_counts(speed, direction) / len(speed) * 100  # Percent of all samples
     
-    ax.set_legend(title="Wind Speed (m/s)", loc='upper left', bbox_to_anchor=(1.1, 1.05))
+    fig = plt.figure(figsize=(12, 10))
+    # Leave room for the legend on the right and the statistics box below
+    ax = fig.add_axes([0.05, 0.12, 0.68, 0.76], projection='polar')
+    ax.set_theta_zero_location('N')
+    ax.set_theta_direction(-1)
+    
+    theta = np.deg2rad(np.arange(WIND_ROSE_SECTORS) * sector_width)
+    width = np.deg2rad(sector_width) * 0.8
+    colors = plt.cm.viridis(np.linspace(0, 1, len(WIND_ROSE_SPEED_BINS) - 1))
+    bottom = np.zeros(WIND_ROSE_SECTORS)
+    for i, (low, high) in enumerate(zip(WIND_ROSE_SPEED_BINS[:-1], WIND_ROSE_SPEED_BINS[1:])):
+        label = f"[{low:g} : {high:g})" if np.isfinite(high) else f">={low:g}"
+        ax.bar(theta, frequency[i], width=width, bottom=bottom, color=colors[i],
+               edgecolor='white', label=label)
+        bottom += frequency[i]
+    
+    ax.set_xticks(np.deg2rad(np.arange(0, 360, 45)))
+    ax.set_xticklabels(['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW'])
+    ax.yaxis.set_major_formatter(lambda value, pos: f"{value:.0f}%")
+    ax.legend(title="Wind Speed (m/s)", loc='upper left', bbox_to_anchor=(1.1, 1.05))
     ax.set_title("Wind Rose", fontsize=16, fontweight='bold', y=1.08)
     
     # Add statistics
-    stats_text = f'Data Points: {len(valid_df)}\n'
-    stats_text += f'Mean Speed: {valid_df[speed_col].mean():.2f} m/s\n'
-    stats_text += f'Max Speed: {valid_df[speed_col].max():.2f} m/s\n'
-    stats_text += f'Prevailing Dir: {valid_df[dir_col].mode().iloc[0]:.0f}°'
+    directions, direction_counts = np.unique(direction, return_counts=True)
+    stats_text = f'Data Points: {len(speed)}\n'
+    stats_text += f'Mean Speed: {speed.mean():.2f} m/s\n'
+    stats_text += f'Max Speed: {speed.max():.2f} m/s\n'
+    stats_text += f'Prevailing Dir: {directions[direction_counts.argmax()]:.0f}°'
     
-    plt.figtext(0.02, 0.02, stats_text, fontsize=10,
-                bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    fig.text(0.02, 0.02, stats_text, fontsize=10,
+             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
     
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
+    _save_figure_async(fig, output_filename, dpi)
     plt.close(fig)
 
-def save_summary_plot(df, output_filename):
+def save_summary_plot(df, output_filename, dpi=DEFAULT_DPI):
     """
     Creates a summary plot with multiple subplots for key parameters.
     """
@@ -346,8 +748,9 @@ def save_summary_plot(df, output_filename):
         axes = [axes]
     
     for i, (param, label) in enumerate(key_params):
-        if param in df.columns and not df[param].isnull().all():
-            axes[i].plot(df.index, df[param], linewidth=1, alpha=0.8)
+        values = df[param].to_numpy(dtype=np.float64, na_value=np.nan)
+        if not np.isnan(values).all():
+            axes[i].plot(*_decimate(df.index.values, values), linewidth=1, alpha=0.8, rasterized=True)
             axes[i].set_ylabel(label, fontsize=12)
             axes[i].grid(True, alpha=0.3)
             axes[i].set_title(f'{PLOT_METADATA.get(param, (param, param))[0]}', fontsize=14)
@@ -355,22 +758,18 @@ def save_summary_plot(df, output_filename):
     axes[-1].set_xlabel("Time (UTC)", fontsize=12)
     
     # Format x-axis
-    duration = df.index.max() - df.index.min()
-    if duration.total_seconds() < 3600:
-        axes[-1].xaxis.set_major_formatter(mdates.DateFormatter('%H:%M:%S'))
-    elif duration.total_seconds() < 86400:
-        axes[-1].xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
-    else:
-        axes[-1].xaxis.set_major_formatter(mdates.DateFormatter('%m/%d %H:%M'))
+    axes[-1].xaxis.set_major_formatter(_date_formatter(df.index.values))
     
     plt.suptitle('Trisonica Data Summary', fontsize=16, fontweight='bold')
-    fig.autofmt_xdate()
-    plt.tight_layout()
+    plt.setp(axes[-1].get_xticklabels(), rotation=30, ha='right')
+    # Margins are fixed in inches so they hold for any number of subplots
+    fig_height = fig.get_figheight()
+    fig.subplots_adjust(left=0.06, right=0.98, top=1 - 1.0 / fig_height, bottom=1.2 / fig_height, hspace=0.35)
     
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
+    _save_figure_async(fig, output_filename, dpi)
     plt.close(fig)
 
-def process_single_file(file_path, output_dir=None):
+def process_single_file(file_path, output_dir=None, dpi=DEFAULT_DPI):
     """
     Process a single log file and generate all plots.
     """
@@ -384,8 +783,15 @@ def process_single_file(file_path, output_dir=None):
     os.makedirs(output_dir, exist_ok=True)
     print(f"[INFO] Output directory: {output_dir}")
     
-    # Parse the log file
-    df = parse_trisonica_log(file_path)
+    # Parse the log file; very large CSV logs are streamed to keep memory bounded
+    column_stats = {}
+    log_format = detect_log_format(file_path)
+    if log_format == 'csv' and os.path.getsize(file_path) > STREAMING_THRESHOLD_BYTES:
+        df, column_stats = stream_csv_log(file_path)
+    elif log_format == 'csv':
+        df, column_stats = parse_csv_log_with_stats(file_path)
+    else:
+        df = parse_trisonica_log(file_path)
     
     if df is None:
         print(f"[ERROR] Failed to parse {file_path}")
@@ -394,18 +800,15 @@ def process_single_file(file_path, output_dir=None):
     print(f"[INFO] Loaded {len(df)} data points with {len(df.columns)} parameters")
     print(f"[INFO] Parameters: {', '.join(df.columns)}")
     
-    # Generate individual parameter plots
-    for column in df.columns:
+    # Generate individual parameter plots, rendered together in one shared figure
+    times, plot_arrays = to_plot_arrays(df)
+    series = []
+    for column, values in plot_arrays.items():
         plot_title, y_axis_label = PLOT_METADATA.get(column, (column, column))
         output_png_path = os.path.join(output_dir, f"{column}_{base_name}.png")
-        
-        save_time_series_plot(
-            df=df, 
-            y_column=column, 
-            title=f'{plot_title} - {base_name}',
-            y_label=y_axis_label,
-            output_filename=output_png_path
-        )
+        series.append((values, f'{plot_title} - {base_name}', y_axis_label,
+                       output_png_path, column_stats.get(column)))
+    save_time_series_plots(times, series, dpi=dpi)
     
     # Generate wind rose plot
     speed_col = 'S2' if 'S2' in df.columns else ('S' if 'S' in df.columns else None)
@@ -414,15 +817,29 @@ def process_single_file(file_path, output_dir=None):
     if speed_col and dir_col:
         wind_rose_path = os.path.join(output_dir, f"WindRose_{base_name}.png")
         save_wind_rose_plot(df=df, speed_col=speed_col, dir_col=dir_col, 
-                           output_filename=wind_rose_path)
+                           output_filename=wind_rose_path, dpi=dpi)
     
     # Generate summary plot
     summary_path = os.path.join(output_dir, f"Summary_{base_name}.png")
-    save_summary_plot(df=df, output_filename=summary_path)
+    save_summary_plot(df=df, output_filename=summary_path, dpi=dpi)
+    
+    # Make sure every PNG is on disk before reporting the file as done
+    wait_for_saves()
     
     print(f"[SUCCESS] Finished processing {base_name}")
     return True
 
+def process_file_safe(file_path, output_dir=None, dpi=DEFAULT_DPI):
+    """
+    Wrapper around process_single_file that reports errors instead of raising (used by worker processes).
+    """
+    print(f"\n{'='*60}")
+    try:
+        return process_single_file(file_path, output_dir, dpi)
+    except Exception as e:
+        print(f"[ERROR] Failed to process {file_path}: {e}")
+        return False
+
 def main():
     parser = argparse.ArgumentParser(description='Trisonica Data Visualization Tool')
     parser.add_argument('files', nargs='*', help='Specific CSV files to process')
@@ -430,8 +847,14 @@ def main():
     parser.add_argument('--output', '-o', help='Output directory for plots')
     parser.add_argument('--recursive', '-r', action='store_true', 
                        help='Search subdirectories recursively')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                       help='Number of files to process in parallel (default: CPU count)')
+    parser.add_argument('--dpi', type=int, default=DEFAULT_DPI,
+                       help=f'PNG resolution in dots per inch (default: {DEFAULT_DPI})')
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got {args.jobs}")
     
     # Determine files to process
     files_to_process = []
@@ -455,22 +878,28 @@ def main():
     
     print(f"[INFO] Found {len(files_to_process)} CSV files to process")
     
-    # Process each file
-    success_count = 0
+    # Detect formats up front so worker processes start from a warm sidecar cache
     for file_path in files_to_process:
-        print(f"\n{'='*60}")
-        try:
-            if process_single_file(file_path, args.output):
-                success_count += 1
-        except Exception as e:
-            print(f"[ERROR] Failed to process {file_path}: {e}")
+        detect_log_format(file_path)
+    save_format_cache()
+    
+    # Process files in parallel; each file is parsed and plotted independently
+    worker = functools.partial(process_file_safe, output_dir=args.output, dpi=args.dpi)
+    cpu_count = os.cpu_count() or 1
+    jobs = min(args.jobs or cpu_count, len(files_to_process))
+    save_threads = max(1, cpu_count // jobs)
+    if jobs > 1:
+        # spawn rather than fork: matplotlib is not fork-safe on every platform
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=set_save_threads, initargs=(save_threads,)) as executor:
+            results = list(executor.map(worker, files_to_process))
+    else:
+        set_save_threads(save_threads)
+        results = [worker(file_path) for file_path in files_to_process]
+    success_count = sum(results)
     
     print(f"\n{'='*60}")
     print(f"[SUMMARY] Successfully processed {success_count}/{len(files_to_process)} files")
-    
-    if not windrose_installed:
-        print("\n[NOTE] To generate wind rose plots, install windrose:")
-        print("pip install windrose")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
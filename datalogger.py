@@ -7,8 +7,15 @@ import sys
 import signal
 import re
 import os
+import io
+import csv
+import selectors
 import glob
 import argparse
+import threading
+import math
+import functools
+import numpy as np
 from collections import deque
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
@@ -22,18 +29,153 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.text import Text
-from rich.align import Align
 from rich import box
 from rich.columns import Columns
 from rich.tree import Tree
+from rich.segment import Segment
+
+try:
+    import numba
+    numba_installed = True
+except ImportError:
+    numba_installed = False
 # from rich.sparkline import Sparkline  # Not available in all Rich versions
 # from rich.bar import Bar
 
 # --- Configuration ---
 DEFAULT_BAUD_RATE = 115200
 MAX_DATAPOINTS = 1000  # Adjust based on Linux system capabilities
-UPDATE_INTERVAL = 0.05  # May need adjustment for different hardware
+UPDATE_INTERVAL = 0.125  # Seconds between display refreshes, independent of the sample rate
 LOG_ROTATION_SIZE = 50 * 1024 * 1024  # 50MB logs
+STATS_SAVE_INTERVAL = 5.0  # Seconds between statistics snapshots while new readings arrive
+RAW_QUEUE_SIZE = 65536  # Raw serial lines buffered between the reader thread and processing
+MAX_LINE_LENGTH = 4096  # Bytes without a newline after which a partial line is discarded
+CSV_FLUSH_ROWS = 256  # Rows buffered before they are written to the data log
+CSV_FLUSH_INTERVAL = 1.0  # Seconds; buffered rows are written at least this often
+LOG_RELEASE_BYTES = 1 << 20  # Written data log bytes synced and dropped from the page cache at a time
+RATE_WINDOW = 1.0  # Seconds of line arrivals counted for each update rate measurement
+MEMORY_CHECK_INTERVAL = 2.0  # Seconds between memory usage measurements for the header
+SCHEMA_STABLE_SAMPLES = 50  # Identical key sequences seen before a specialized parser is generated
+
+# Display unit and plausible (low, high) range per parameter
+PARAMETER_RANGES = {
+    'S': ("m/s", 0, 50), 'S1': ("m/s", 0, 50), 'S2': ("m/s", 0, 50), 'S3': ("m/s", 0, 50),
+    'T': ("°C", -40, 60), 'T1': ("°C", -40, 60), 'T2': ("°C", -40, 60),
+    'D': ("°", 0, 360),
+    'U': ("m/s", -50, 50), 'V': ("m/s", -50, 50), 'W': ("m/s", -50, 50),
+    'H': ("%", 0, 100),
+    'P': ("hPa", 900, 1100),
+    'PI': ("°", -45, 45), 'RO': ("°", -45, 45),
+    'MD': ("°", 0, 360), 'TD': ("°", 0, 360),
+}
+
+COMPASS_POINTS_16 = ('N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                     'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW')
+COMPASS_POINTS_8 = ('N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW')
+# Compass names per quarter degree; every sector boundary (11.25 + k*22.5) is a whole quarter degree
+_COMPASS_16_LUT = tuple(COMPASS_POINTS_16[(q + 45) // 90 % 16] for q in range(1440))
+_COMPASS_8_LUT = tuple(COMPASS_POINTS_8[(q + 90) // 180 % 8] for q in range(1440))
+
+# Every bar string the trend and sparkline panels can draw, built once
+_TREND_BARS = tuple("█" * i + "░" * (8 - i) for i in range(9))
+_SPARKLINE_BARS = tuple("█" * i for i in range(31))
+
+@functools.lru_cache(maxsize=32)
+def _build_row_formatter(columns):
+    """Generate format_row(timestamp, parsed) -> CSV row bytes for these value columns.
+    
+    The row is a single f-string over the columns in order; a reading that lacks
+    one of them raises KeyError so the caller can fill the blanks instead.
+    """
+    # Keys are bound as names, so any characters a sensor sends are safe in the source
+    fields = "".join(f",{{parsed[_k{i}]}}" for i in range(len(columns)))
+    source = (
+        "def format_row(timestamp, parsed):\n"
+        f"    return f\"{{timestamp}}{fields}\\n\".encode('ascii')\n"
+    )
+    namespace = {f'_k{i}': column for i, column in enumerate(columns)}
+    exec(source, namespace)
+    return namespace['format_row']
+
+def _csv_line(fields) -> bytes:
+    """Format one CSV line exactly as csv.writer does, quoting fields that need it"""
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator='\n').writerow(fields)
+    return buf.getvalue().encode('ascii')
+
+# Sensors shown in the data quality panel, and the colour-coded markup per health status
+KEY_SENSORS = ('S', 'T', 'P', 'D', 'H')
+_STATUS_MARKUP = {
+    'Good': "[green]●[/green] Good",
+    'Error': "[red]●[/red] Error",
+    'Malfunction': "[red]●[/red] Broken",
+    'Offline': "[yellow]●[/yellow] Offline",
+}
+
+# Data quality panel border for error rates below 1%, below 5%, and above
+_QUALITY_BORDERS = ("bright_green", "bright_yellow", "bright_red")
+
+@functools.lru_cache(maxsize=None)
+def _sensor_status_line(sensor: str, status: str) -> str:
+    return f"{sensor:>2}: {_STATUS_MARKUP.get(status, '[dim]●[/dim] Unknown')}"
+
+# "KEY value" pairs, comma- or space-separated, matched directly on raw serial bytes
+_PAIR_RE = re.compile(rb'([^\s,]+)[ \t]+([^\s,]+)')
+
+def _parse_pairs(line: bytes) -> Dict[str, str]:
+    """Generic parser: every KEY value pair on the line, in order"""
+    return {key.decode('ascii', errors='ignore'): value.decode('ascii', errors='ignore')
+            for key, value in _PAIR_RE.findall(line)}
+
+@functools.lru_cache(maxsize=32)
+def _build_schema_parser(keys):
+    """Generate a parser for lines carrying exactly these keys in this order.
+    
+    The whole line is checked with one anchored regex and the dict is built as a
+    literal; lines that do not match return None so the caller can fall back.
+    Parsers are cached per key tuple, so a format seen before is not regenerated.
+    """
+    pattern = rb'[\s,]+'.join(re.escape(key.encode('ascii')) + rb'[ \t]+([^\s,]+)' for key in keys)
+    items = ", ".join(f"{key!r}: g[{i}].decode('ascii', 'ignore')" for i, key in enumerate(keys))
+    source = (
+        "def schema_parse(line, _match=_match):\n"
+        "    m = _match(line)\n"
+        "    if m is None:\n"
+        "        return None\n"
+        "    g = m.groups()\n"
+        f"    return {{{items}}}\n"
+    )
+    namespace = {'_match': re.compile(pattern).fullmatch}
+    exec(source, namespace)
+    return namespace['schema_parse']
+
+if numba_installed:
+    @numba.njit(cache=True)
+    def _mean_direction_jit(directions):
+        """Circular mean of a float64 array of degrees, summed in one compiled loop"""
+        sin_sum = 0.0
+        cos_sum = 0.0
+        for i in range(directions.shape[0]):
+            rad = directions[i] * 0.017453292519943295
+            sin_sum += math.sin(rad)
+            cos_sum += math.cos(rad)
+        return math.degrees(math.atan2(sin_sum, cos_sum)) % 360.0
+        
+    @numba.njit(cache=True)
+    def _window_update_jit(buf, idx, filled, mean, m2, value):
+        """RingBuffer.append_windowed on the raw array; returns (idx, filled, mean, m2)"""
+        capacity = buf.shape[0]
+        if filled == capacity:
+            evicted = buf[idx]
+            buf[idx] = value
+            new_mean = mean + (value - evicted) / filled
+            m2 += (value - evicted) * (value - new_mean + evicted - mean)
+        else:
+            buf[idx] = value
+            filled += 1
+            new_mean = mean + (value - mean) / filled
+            m2 += (value - mean) * (value - new_mean)
+        return (idx + 1) % capacity, filled, new_mean, m2
 
 @dataclass
 class Config:
@@ -47,9 +189,69 @@ class Config:
 
 @dataclass
 class DataPoint:
-    timestamp: datetime.datetime
-    raw_data: str
+    timestamp_ns: int  # Arrival time, ns since the epoch
+    raw_line: bytes  # Stripped serial line as received
     parsed_data: Dict[str, str] = field(default_factory=dict)
+    parsed_floats: Dict[str, float] = field(default_factory=dict)  # Values that parsed as numbers
+    
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """Local arrival time, only built when something displays it"""
+        return datetime.datetime.fromtimestamp(self.timestamp_ns / 1e9)
+        
+    @property
+    def raw_data(self) -> str:
+        """Decoded raw line, only built for the points the raw data panel shows"""
+        return self.raw_line.decode('ascii', errors='ignore')
+
+class RingBuffer:
+    """Fixed-capacity ring buffer backed by a preallocated NumPy array (float64 unless given a dtype)"""
+    def __init__(self, capacity: int, dtype=np.float64):
+        self._buf = np.empty(capacity, dtype=dtype)
+        self._idx = 0
+        self._filled = 0
+        
+    def append(self, value: float):
+        self._buf[self._idx] = value
+        self._idx = (self._idx + 1) % len(self._buf)
+        if self._filled < len(self._buf):
+            self._filled += 1
+            
+    def __len__(self) -> int:
+        return self._filled
+        
+    def view(self) -> np.ndarray:
+        """Filled slots in storage order; fine for order-independent reductions"""
+        return self._buf[:self._filled]
+        
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+        
+    def last(self) -> float:
+        return self._buf[self._idx - 1].item()
+        
+    def ordered(self) -> np.ndarray:
+        """Filled slots from oldest to newest"""
+        if self._filled < len(self._buf):
+            return self._buf[:self._filled]
+        return np.concatenate((self._buf[self._idx:], self._buf[:self._idx]))
+        
+    def append_windowed(self, value: float, mean: float, m2: float):
+        """Append value and return the buffer's updated (mean, m2) by Welford's recurrence"""
+        if numba_installed:
+            self._idx, self._filled, mean, m2 = _window_update_jit(
+                self._buf, self._idx, self._filled, mean, m2, value)
+            return mean, m2
+        if self._filled == len(self._buf):
+            # Buffer is full: swap the evicted sample's contribution for the new one
+            evicted = self._buf[self._idx].item()
+            self.append(value)
+            new_mean = mean + (value - evicted) / self._filled
+            return new_mean, m2 + (value - evicted) * (value - new_mean + evicted - mean)
+        self.append(value)
+        new_mean = mean + (value - mean) / self._filled
+        return new_mean, m2 + (value - mean) * (value - new_mean)
 
 @dataclass
 class Statistics:
@@ -57,9 +259,112 @@ class Statistics:
     max_val: float = 0.0
     mean_val: float = 0.0
     current_val: float = 0.0
-    std_dev: float = 0.0
     count: int = 0
-    values: deque = field(default_factory=lambda: deque(maxlen=100))
+    m2: float = 0.0  # Sum of squared deviations over the rolling window (Welford)
+    values: RingBuffer = field(default_factory=lambda: RingBuffer(100))
+    
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the window, derived only when read"""
+        if not len(self.values):
+            return 0.0
+        # Rounding can leave m2 marginally negative for a constant signal
+        return (max(self.m2, 0.0) / len(self.values)) ** 0.5
+
+class BatchedLogWriter:
+    """Append-only log file written by a background thread, one writev() per submitted batch"""
+    def __init__(self, path: str):
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        self._iov_max = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') else 1024
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._closing = False
+        self._offset = 0  # Bytes written so far, and how many of them were released from the page cache
+        self._released = 0
+        self.closed = False
+        self.error = None  # First failed write; checked by the run loop, never raised at submitters
+        self._thread = threading.Thread(target=self._run, name="csv-writer", daemon=True)
+        self._thread.start()
+        
+    def write(self, data):
+        self.writelines((data,))
+        
+    def writelines(self, chunks):
+        """Queue bytes chunks to be written together; returns without blocking"""
+        batch = list(chunks)
+        with self._cond:
+            self._pending.append(batch)
+            self._cond.notify()
+            
+    def close(self):
+        if self.closed:
+            return
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join()
+        os.close(self._fd)
+        self.closed = True
+        
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._closing)
+                # Everything queued since the last wake-up goes out in one writev() pass
+                chunks = [chunk for batch in self._pending for chunk in batch]
+                self._pending.clear()
+                closing = self._closing
+            if chunks:
+                try:
+                    self._offset += sum(map(len, chunks))
+                    self._write_batch(chunks)
+                    if self._offset - self._released >= LOG_RELEASE_BYTES:
+                        self._release_written()
+                except OSError as e:
+                    if self.error is None:
+                        self.error = e
+            if closing:
+                return
+                
+    def _release_written(self):
+        """Sync the data written since the last release and tell the kernel it will not be read back"""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            os.fdatasync(self._fd)
+            os.posix_fadvise(self._fd, self._released, self._offset - self._released, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            return
+        self._released = self._offset
+        
+    def _write_batch(self, batch):
+        # writev() may write only part of the data; resume from where it stopped
+        i = 0
+        while i < len(batch):
+            written = os.writev(self._fd, batch[i:i + self._iov_max])
+            while i < len(batch) and written >= len(batch[i]):
+                written -= len(batch[i])
+                i += 1
+            if written:
+                batch[i] = batch[i][written:]
+
+class StaticRenderable:
+    """Wraps a renderable that never changes and replays its rendered lines while the size is unchanged"""
+    def __init__(self, renderable):
+        self.renderable = renderable
+        self._size = None
+        self._lines = []
+        
+    def __rich_console__(self, console, options):
+        size = (options.max_width, options.height)
+        if size != self._size:
+            self._lines = console.render_lines(self.renderable, options, pad=True)
+            self._size = size
+        new_line = Segment.line()
+        for i, line in enumerate(self._lines):
+            if i:
+                yield new_line
+            yield from line
 
 class TrisonicaDataLoggerLinux:
     def __init__(self, config: Config):
@@ -72,24 +377,49 @@ class TrisonicaDataLoggerLinux:
         self.start_time = time.time()
         
         # Data storage
-        self.data_points = deque(maxlen=MAX_DATAPOINTS)
+        self.arrival_times = RingBuffer(MAX_DATAPOINTS, np.int64)  # ns since epoch, one slot per point
+        self.recent_points = deque(maxlen=5)  # Only the points the current-data and raw panels render
+        self._raw_q = deque(maxlen=RAW_QUEUE_SIZE)  # (arrival time ns, raw line) from the reader thread
+        self._stats_lock = threading.RLock()  # Guards Statistics updates against snapshots taken mid-update
+        self._stats_write_lock = threading.RLock()  # Serializes statistics snapshot writes between threads
+        self._stats_dirty = False  # New readings since the last periodic snapshot
+        self._stats_stop = threading.Event()
+        self._data_ready = threading.Event()  # Set by the reader thread whenever it queues lines
+        self._shutdown_r = None  # Self-pipe that wakes the reader thread's select() on shutdown
+        self._shutdown_w = None
         self.point_count = 0
         self.stats = {}
         
         # CSV column management
         self.csv_columns = ['timestamp']  # Start with timestamp
+        self._csv_column_set = set(self.csv_columns)
         self.csv_headers_written = False
+        self._value_columns = ()  # csv_columns after 'timestamp', refreshed when columns are added
+        self._format_row = _build_row_formatter(self._value_columns)
+        self._schema_keys = ()  # Key sequence of the latest lines and how many in a row had it
+        self._schema_run = 0
+        self._schema_parser = None  # Generated once the key sequence is stable
+        self._ts_second = None  # Epoch second whose formatted date/time is cached in _ts_prefix
+        self._ts_prefix = ''
+        self._row_buf = []  # Formatted rows waiting to be written
+        self._last_flush = time.monotonic()
         
         # Linux specific
-        self.last_update = time.time()
+        self.last_update = time.time()  # Start of the current update rate window
+        self._rate_count = 0  # Lines arrived in that window
         self.update_rate = 0.0
+        self._last_render = 0.0
+        self._panel_keys = {}  # Panel name -> (layout id, inputs) it was last drawn from
+        self._display_dirty = False  # A panel changed since the screen was last repainted
+        self._memory_usage = ""  # Header memory figure and the runtime (s) it was measured at
+        self._memory_checked_at = -MEMORY_CHECK_INTERVAL
         
         # Visualization data storage
         self.viz_data = {
-            'wind_speed': deque(maxlen=50),      # S or S2 values
-            'temperature': deque(maxlen=50),     # T values
-            'wind_direction': deque(maxlen=50),  # D values
-            'timestamps': deque(maxlen=50)       # For trend analysis
+            'wind_speed': RingBuffer(50),        # S or S2 values
+            'temperature': RingBuffer(50),       # T values
+            'wind_direction': RingBuffer(50),    # D values
+            'timestamps': RingBuffer(50, np.int64)  # Arrival times (ns since epoch) for trend analysis
         }
 
         # Data quality tracking
@@ -100,12 +430,13 @@ class TrisonicaDataLoggerLinux:
             'sensor_health': {},
             'connection_drops': 0,
             'last_connection_time': time.time(),
+            'dropped_lines': 0,  # Lines lost to a full raw queue or discarded as overlong
             'parameter_errors': {}  # Track errors per parameter
         }
 
         # Recent wind measurements for trend analysis
-        self.recent_wind_speeds = deque(maxlen=1000)  # Last 1000 wind speed readings
-        self.recent_wind_directions = deque(maxlen=1000)  # Last 1000 wind direction readings
+        self.recent_wind_speeds = RingBuffer(1000)  # Last 1000 wind speed readings
+        self.recent_wind_directions = RingBuffer(1000)  # Last 1000 wind direction readings
         
         # Ensure log directory exists
         os.makedirs(config.log_dir, exist_ok=True)
@@ -209,13 +540,15 @@ class TrisonicaDataLoggerLinux:
         # Data log
         self.log_filename = f"TrisonicaData_{timestamp}.csv"
         self.log_path = os.path.join(self.config.log_dir, self.log_filename)
-        self.log_file = open(self.log_path, 'w', newline='')
+        self.log_file = BatchedLogWriter(self.log_path)
         # Headers will be written dynamically when first data arrives
         
         # Statistics log
         if self.config.save_statistics:
             self.stats_filename = f"TrisonicaStats_{timestamp}.csv"
             self.stats_path = os.path.join(self.config.log_dir, self.stats_filename)
+            # Plain buffered appends: each snapshot reaches the file with one write() on flush,
+            # and the file never holds more than what was written, even after a crash
             self.stats_file = open(self.stats_path, 'w', newline='')
             self.stats_file.write("timestamp,parameter,min,max,mean,std_dev,count,error_count,error_rate_percent,total_readings\n")
             
@@ -226,8 +559,18 @@ class TrisonicaDataLoggerLinux:
     def signal_handler(self, signum, frame):
         """Enhanced signal handler"""
         self.console.print(f"\n[SHUTDOWN] Received signal {signum}, saving data and shutting down...", style="bold yellow")
+        self.flush_csv_rows()
         self.save_final_statistics()
         self.running = False
+        self.wake_reader()
+        
+    def wake_reader(self):
+        """Interrupt the reader thread's select() so shutdown does not wait out the port timeout"""
+        if self._shutdown_w is not None:
+            try:
+                os.write(self._shutdown_w, b'x')
+            except OSError:
+                pass
         
     def connect_serial(self) -> bool:
         """Connect with enhanced error handling"""
@@ -246,157 +589,280 @@ class TrisonicaDataLoggerLinux:
             self.console.print(f"[ERROR] Connection failed: {e}", style="bold red")
             return False
             
-    def parse_data_line(self, line: str) -> Dict[str, str]:
-        """Enhanced parsing with better error handling"""
-        parsed = {}
-        try:
-            # Handle multiple possible formats
-            if ',' in line:
-                pairs = line.strip().split(',')
-                for pair in pairs:
-                    pair = pair.strip()
-                    if ' ' in pair:
-                        parts = pair.split(' ', 1)
-                        if len(parts) == 2:
-                            key, value = parts
-                            parsed[key.strip()] = value.strip()
-            else:
-                # Space-separated format
-                parts = line.strip().split()
-                for i in range(0, len(parts)-1, 2):
-                    if i+1 < len(parts):
-                        parsed[parts[i]] = parts[i+1]
-                        
-        except Exception as e:
-            # Log parsing errors but continue
-            pass
-            
+    def parse_data_line(self, line) -> Dict[str, str]:
+        """Parse KEY value pairs from a serial line, given as str or raw bytes"""
+        if isinstance(line, str):
+            line = line.encode('ascii', errors='ignore')
+        if self._schema_parser is not None:
+            parsed = self._schema_parser(line)
+            if parsed is not None:
+                return parsed
+                
+        # One regex scan in C instead of nested split() calls per pair
+        parsed = _parse_pairs(line)
+        keys = tuple(parsed)
+        if self._schema_parser is not None:
+            # Keep the specialized parser through garbled lines; drop it when a new parameter appears
+            if not set(keys) <= set(self._schema_keys):
+                self._schema_parser = None
+                self._schema_keys = keys
+                self._schema_run = 1
+        elif keys == self._schema_keys:
+            self._schema_run += 1
+            if keys and self._schema_run >= SCHEMA_STABLE_SAMPLES:
+                self._schema_parser = _build_schema_parser(keys)
+        else:
+            self._schema_keys = keys
+            self._schema_run = 1
         return parsed
     
     def update_csv_columns(self, parsed_data: Dict[str, str]):
         """Update CSV columns based on new parameters found"""
+        # Steady state: every key is already a column, checked as one C-level set comparison
+        if self.csv_headers_written and parsed_data.keys() <= self._csv_column_set:
+            return
+            
         new_columns = False
         for key in parsed_data.keys():
-            if key not in self.csv_columns:
+            if key not in self._csv_column_set:
                 self.csv_columns.append(key)
+                self._csv_column_set.add(key)
                 new_columns = True
+        if new_columns:
+            self._value_columns = tuple(self.csv_columns[1:])
+            self._format_row = _build_row_formatter(self._value_columns)
         
         # Write headers if this is the first data or if new columns were added
         if not self.csv_headers_written:
-            self.log_file.write(','.join(self.csv_columns) + '\n')
+            self.log_file.write(_csv_line(self.csv_columns))
             self.csv_headers_written = True
             
-    def write_csv_row(self, timestamp: datetime.datetime, parsed_data: Dict[str, str]):
+    def format_timestamp(self, ts_ns: int) -> str:
+        """ISO 8601 local time with microseconds; the date/time part is reused within a second"""
+        second = ts_ns // 1_000_000_000
+        if second != self._ts_second:
+            self._ts_second = second
+            self._ts_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        return f"{self._ts_prefix}.{ts_ns // 1000 % 1_000_000:06d}"
+        
+    def write_csv_row(self, ts_ns: int, parsed_data: Dict[str, str]):
         """Write a properly formatted CSV row"""
-        row_values = []
-        for column in self.csv_columns:
-            if column == 'timestamp':
-                row_values.append(timestamp.isoformat())
-            else:
-                # Get value for this column, or empty string if not present
-                value = parsed_data.get(column, '')
-                row_values.append(value)
+        timestamp = self.format_timestamp(ts_ns)
+        try:
+            # Common case: the reading has every known column
+            row = self._format_row(timestamp, parsed_data)
+        except KeyError:
+            # Get value for each column, or empty string if not present
+            get = parsed_data.get
+            row_values = [get(column, '') for column in self._value_columns]
+            row = (','.join((timestamp, *row_values)) + '\n').encode('ascii')
+        # A value holding a comma or quote needs csv quoting; one count and one scan of the row find it
+        if row.count(b',') != len(self._value_columns) or b'"' in row:
+            get = parsed_data.get
+            row = _csv_line((timestamp, *[get(column, '') for column in self._value_columns]))
         
-        self.log_file.write(','.join(row_values) + '\n')
-        self.log_file.flush()
+        # Rows are kept as bytes: values are ASCII, so this is a single encode with no codec lookup per value
+        self._row_buf.append(row)
+        if len(self._row_buf) >= CSV_FLUSH_ROWS or time.monotonic() - self._last_flush > CSV_FLUSH_INTERVAL:
+            self.flush_csv_rows()
+            
+    def flush_stale_rows(self):
+        """Write buffered rows once CSV_FLUSH_INTERVAL has passed since the last write, even if no new row arrives"""
+        if self._row_buf and time.monotonic() - self._last_flush > CSV_FLUSH_INTERVAL:
+            self.flush_csv_rows()
+            
+    def flush_csv_rows(self):
+        """Hand buffered CSV rows to the log writer thread as one batch"""
+        # Detach the rows before submitting them, so a signal handler that flushes
+        # again mid-submit finds an empty buffer instead of writing the rows twice
+        rows, self._row_buf = self._row_buf, []
+        if rows and self.log_file and not self.log_file.closed:
+            self.log_file.writelines(rows)
+        self._last_flush = time.monotonic()
         
     def calculate_statistics(self, key: str, value: float):
         """Enhanced statistics with standard deviation"""
-        if key not in self.stats:
-            self.stats[key] = Statistics()
+        # Snapshots copy these fields under the same lock, so they never see half an update
+        with self._stats_lock:
+            if key not in self.stats:
+                self.stats[key] = Statistics()
+                
+            stat = self.stats[key]
+            stat.current_val = value
+            stat.count += 1
             
-        stat = self.stats[key]
-        stat.current_val = value
-        stat.count += 1
-        stat.values.append(value)
-        
-        if stat.count == 1:
-            stat.min_val = stat.max_val = stat.mean_val = value
-            stat.std_dev = 0.0
-        else:
-            stat.min_val = min(stat.min_val, value)
-            stat.max_val = max(stat.max_val, value)
+            if stat.count == 1:
+                stat.min_val = stat.max_val = value
+            else:
+                if value < stat.min_val:
+                    stat.min_val = value
+                if value > stat.max_val:
+                    stat.max_val = value
             
-            # Calculate mean
-            stat.mean_val = sum(stat.values) / len(stat.values)
+            # Rolling mean/std over the window, updated in O(1) with Welford's recurrence
+            window = stat.values
+            stat.mean_val, stat.m2 = window.append_windowed(value, stat.mean_val, stat.m2)
             
-            # Calculate standard deviation
-            if len(stat.values) > 1:
-                variance = sum((x - stat.mean_val) ** 2 for x in stat.values) / len(stat.values)
-                stat.std_dev = variance ** 0.5
+            # Once per window length, recompute exactly from the buffer so rounding errors cannot accumulate
+            if stat.count % window.capacity == 0:
+                values = window.view()
+                stat.mean_val = float(values.mean())
+                stat.m2 = float(((values - stat.mean_val) ** 2).sum())
                 
-    def read_serial_data(self) -> Optional[DataPoint]:
-        """Enhanced data reading with performance metrics"""
-        if not self.serial_port or not self.serial_port.is_open:
-            return None
+    def serial_reader(self):
+        """Producer thread: only reads raw lines and queues them with their arrival time"""
+        try:
+            os.nice(-5)  # Linux nice values are per thread; needs CAP_SYS_NICE
+        except OSError:
+            pass
             
+        # Drain everything the driver has buffered in one read() instead of readline(),
+        # which pyserial implements as one read per byte, and split lines ourselves
+        pending = bytearray()
+        
+        # Wait on the port and the shutdown pipe together; ports without a
+        # selectable descriptor fall back to the blocking read below
+        sel = selectors.DefaultSelector()
+        try:
+            sel.register(self.serial_port.fileno(), selectors.EVENT_READ)
+            sel.register(self._shutdown_r, selectors.EVENT_READ)
+        except (AttributeError, ValueError, TypeError, OSError):
+            sel.close()
+            sel = None
+            
+        while self.running:
+            if sel is not None:
+                events = sel.select(timeout=0.5)
+                if any(key.fd == self._shutdown_r for key, _ in events):
+                    break
+                if not events:
+                    continue
+            try:
+                # Blocks (up to the port timeout) for at least one byte when nothing is waiting
+                chunk = self.serial_port.read(max(1, self.serial_port.in_waiting))
+            except Exception:
+                self.data_quality['connection_drops'] += 1
+                time.sleep(0.1)
+                continue
+            if not chunk:
+                continue
+            pending += chunk
+            ts_ns = time.time_ns()
+            start = 0
+            end = pending.find(b'\n')
+            while end != -1:
+                if len(self._raw_q) == self._raw_q.maxlen:
+                    self.data_quality['dropped_lines'] += 1
+                self._raw_q.append((ts_ns, bytes(pending[start:end])))
+                start = end + 1
+                end = pending.find(b'\n', start)
+            if start:
+                self._data_ready.set()
+            del pending[:start]
+            if len(pending) > MAX_LINE_LENGTH:
+                # No newline in sight (wrong baud rate or line noise); don't let the buffer grow without bound
+                self.data_quality['dropped_lines'] += 1
+                pending.clear()
+            
+        if sel is not None:
+            sel.close()
+                
+    def statistics_saver(self):
+        """Background thread: write a statistics snapshot every STATS_SAVE_INTERVAL while data arrives"""
+        while not self._stats_stop.wait(STATS_SAVE_INTERVAL):
+            if self._stats_dirty:
+                self.save_final_statistics()
+                
+    def process_queued_lines(self):
+        """Consumer side: process every line that was queued when the call started"""
+        # Only this thread pops, so the queue holds at least this many lines throughout
+        for _ in range(len(self._raw_q)):
+            ts_ns, raw = self._raw_q.popleft()
+            data_point = self.process_line(raw, ts_ns)
+            if data_point:
+                self.point_count += 1
+                self.arrival_times.append(data_point.timestamp_ns)
+                self.recent_points.append(data_point)
+                self._stats_dirty = True  # Picked up by the statistics thread
+                    
+    def process_line(self, raw: bytes, ts_ns: int) -> Optional[DataPoint]:
+        """Enhanced data processing with performance metrics"""
         try:
-            line = self.serial_port.readline().decode('ascii', errors='ignore').strip()
-            if not line:
+            raw = raw.strip()
+            if not raw:
                 return None
                 
-            timestamp = datetime.datetime.now()
-            parsed = self.parse_data_line(line)
+            parsed = self.parse_data_line(raw)
             
             # Update CSV columns and write properly formatted row
             self.update_csv_columns(parsed)
-            self.write_csv_row(timestamp, parsed)
+            self.write_csv_row(ts_ns, parsed)
             
             # Update statistics and track data quality
             self.data_quality['total_readings'] += 1
-            for key, value_str in parsed.items():
-                try:
-                    value = float(value_str)
-
-                    # Initialize parameter error tracking if needed
-                    if key not in self.data_quality['parameter_errors']:
-                        self.data_quality['parameter_errors'][key] = {
-                            'error_count': 0,
-                            'total_count': 0
-                        }
-
-                    # Track total readings for this parameter
-                    self.data_quality['parameter_errors'][key]['total_count'] += 1
-
-                    # Check for error values and update sensor health
-                    # Trisonica uses various -99.x values to indicate sensor errors
-                    is_error = value <= -99.0
-                    if key == 'T' and value < 0:  # Temperature should not be negative
-                        is_error = True
-
-                    self.update_sensor_health(key, value, is_error)
-
-                    if is_error:
-                        # Track errors per parameter
-                        self.data_quality['parameter_errors'][key]['error_count'] += 1
-                    else:
-                        self.calculate_statistics(key, value)
-
-                        # Update visualization data
-                        if key in ['S', 'S2']:  # Wind speed
-                            self.viz_data['wind_speed'].append(value)
-                            # Track recent wind speeds for 300-measurement analysis
-                            self.recent_wind_speeds.append(value)
-                        elif key == 'T':  # Temperature
-                            self.viz_data['temperature'].append(value)
-                        elif key == 'D':  # Wind direction
-                            self.viz_data['wind_direction'].append(value)
-                            # Track recent wind directions for 1000-measurement analysis
-                            self.recent_wind_directions.append(value)
-
-                except ValueError:
-                    self.update_sensor_health(key, 0, True)
+            now = ts_ns / 1e9
+            try:
+                # Usually every field is numeric: convert the whole line in one C-level pass
+                parsed_floats = dict(zip(parsed, map(float, parsed.values())))
+            except ValueError:
+                parsed_floats = {}
+                for key, value_str in parsed.items():
+                    try:
+                        parsed_floats[key] = float(value_str)
+                    except ValueError:
+                        self.update_sensor_health(key, 0, True, now)
+                        
+            for key, value in parsed_floats.items():
+                # Initialize parameter error tracking if needed
+                if key not in self.data_quality['parameter_errors']:
+                    self.data_quality['parameter_errors'][key] = {
+                        'error_count': 0,
+                        'total_count': 0
+                    }
+
+                # Track total readings for this parameter
+                self.data_quality['parameter_errors'][key]['total_count'] += 1
+
+                # Check for error values and update sensor health
+                # Trisonica uses various -99.x values to indicate sensor errors
+                is_error = value <= -99.0
+                if key == 'T' and value < 0:  # Temperature should not be negative
+                    is_error = True
+
+                self.update_sensor_health(key, value, is_error, now)
+
+                if is_error:
+                    # Track errors per parameter
+                    self.data_quality['parameter_errors'][key]['error_count'] += 1
+                else:
+                    self.calculate_statistics(key, value)
+
+                    # Update visualization data
+                    if key in ['S', 'S2']:  # Wind speed
+                        self.viz_data['wind_speed'].append(value)
+                        # Track recent wind speeds for 300-measurement analysis
+                        self.recent_wind_speeds.append(value)
+                    elif key == 'T':  # Temperature
+                        self.viz_data['temperature'].append(value)
+                    elif key == 'D':  # Wind direction
+                        self.viz_data['wind_direction'].append(value)
+                        # Track recent wind directions for 1000-measurement analysis
+                        self.recent_wind_directions.append(value)
                     
             # Update timestamps for visualization
-            self.viz_data['timestamps'].append(timestamp)
+            self.viz_data['timestamps'].append(ts_ns)
                     
-            # Calculate update rate
-            now = time.time()
-            if now - self.last_update > 0:
-                self.update_rate = 1.0 / (now - self.last_update)
-            self.last_update = now
+            # Calculate update rate from arrival times, not processing times; lines from
+            # one bulk read share a timestamp, so count them over a window instead of
+            # taking the gap between consecutive lines
+            self._rate_count += 1
+            elapsed = now - self.last_update
+            if elapsed >= RATE_WINDOW:
+                self.update_rate = self._rate_count / elapsed
+                self._rate_count = 0
+                self.last_update = now
             
-            return DataPoint(timestamp, line, parsed)
+            return DataPoint(ts_ns, raw, parsed, parsed_floats)
             
         except Exception as e:
             return None
@@ -406,72 +872,66 @@ class TrisonicaDataLoggerLinux:
         if not self.config.save_statistics or not self.stats_file:
             return
 
-        timestamp = datetime.datetime.now().isoformat()
-
-        # Get all parameters that had any data (stats or errors)
-        all_parameters = set(self.stats.keys()) | set(self.data_quality['parameter_errors'].keys())
-
-        for key in all_parameters:
-            # Get statistics (if available)
-            if key in self.stats:
-                stat = self.stats[key]
-                min_val = stat.min_val
-                max_val = stat.max_val
-                mean_val = stat.mean_val
-                std_dev = stat.std_dev
-                good_count = stat.count
-            else:
-                # No valid data for this parameter
-                min_val = max_val = mean_val = std_dev = 0.0
-                good_count = 0
-
-            # Get error data (if available)
-            if key in self.data_quality['parameter_errors']:
-                error_data = self.data_quality['parameter_errors'][key]
-                error_count = error_data['error_count']
-                total_readings = error_data['total_count']
-                error_rate = (error_count / total_readings * 100) if total_readings > 0 else 0.0
-            else:
-                error_count = 0
-                total_readings = good_count
-                error_rate = 0.0
+        # Also called from the periodic stats thread and the signal handler. Copy the statistics
+        # under the lock calculate_statistics holds, so every row describes one consistent
+        # state; the file is written afterwards, never while holding both locks
+        with self._stats_lock:
+            self._stats_dirty = False
+            timestamp = datetime.datetime.now().isoformat()
+            snapshot = {key: (stat.min_val, stat.max_val, stat.mean_val, stat.std_dev, stat.count)
+                        for key, stat in self.stats.items()}
+
+        with self._stats_write_lock:
+            # Get all parameters that had any data (stats or errors)
+            all_parameters = set(snapshot) | set(self.data_quality['parameter_errors'].keys())
+
+            for key in all_parameters:
+                # Get statistics (if available)
+                if key in snapshot:
+                    min_val, max_val, mean_val, std_dev, good_count = snapshot[key]
+                else:
+                    # No valid data for this parameter
+                    min_val = max_val = mean_val = std_dev = 0.0
+                    good_count = 0
+
+                # Get error data (if available)
+                if key in self.data_quality['parameter_errors']:
+                    error_data = self.data_quality['parameter_errors'][key]
+                    error_count = error_data['error_count']
+                    total_readings = error_data['total_count']
+                    error_rate = (error_count / total_readings * 100) if total_readings > 0 else 0.0
+                else:
+                    error_count = 0
+                    total_readings = good_count
+                    error_rate = 0.0
 
-            # Write comprehensive stats line
-            self.stats_file.write(f"{timestamp},{key},{min_val:.6f},{max_val:.6f},"
-                                f"{mean_val:.6f},{std_dev:.6f},{good_count},"
-                                f"{error_count},{error_rate:.2f},{total_readings}\n")
+                # Write comprehensive stats line
+                self.stats_file.write(f"{timestamp},{key},{min_val:.6f},{max_val:.6f},"
+                                    f"{mean_val:.6f},{std_dev:.6f},{good_count},"
+                                    f"{error_count},{error_rate:.2f},{total_readings}\n")
 
-        self.stats_file.flush()
+            self.stats_file.flush()
     
-    def create_sparkline(self, data: deque, title: str, direction_data: deque = None) -> Panel:
+    def create_sparkline(self, data: RingBuffer, title: str, direction_data: RingBuffer = None) -> Panel:
         """Create a sparkline visualization"""
         if len(data) < 2:
             return Panel(f"[dim]Collecting {title} data...[/dim]", title=title)
 
         try:
-            # Convert to list and ensure we have numeric data
-            values = [float(x) for x in data if x is not None]
-            if not values:
-                return Panel(f"[dim]No {title} data[/dim]", title=title)
-
-            # Add current value and trend
-            current = values[-1]
+            # Add current value and trend; the buffer already holds floats
+            current = data.last()
 
             # Create sparkline (simplified without Sparkline library)
             # sparkline = Sparkline(values, width=30)
-            sparkline = "█" * min(30, int(current/max(values) * 30)) if values else ""
+            sparkline = _SPARKLINE_BARS[max(0, min(30, int(current / data.view().max() * 30)))]
 
             # Add wind direction if provided
             direction_text = ""
-            if direction_data and len(direction_data) > 0:
+            if direction_data is not None and len(direction_data) > 0:
                 try:
-                    current_dir = float(direction_data[-1])
-                    # Convert to compass direction
-                    compass_points = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                                     'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-                    index = int((current_dir + 11.25) / 22.5) % 16
+                    current_dir = direction_data.last()
                     # Fixed width formatting - pad compass direction to 3 characters
-                    direction_text = f" from {compass_points[index]:>3} ({current_dir:3.0f}°)"
+                    direction_text = f" from {self.get_compass_direction(current_dir):>3} ({current_dir:3.0f}°)"
                 except:
                     pass
 
@@ -481,18 +941,16 @@ class TrisonicaDataLoggerLinux:
         except Exception as e:
             return Panel(f"[red]Error: {e}[/red]", title=title)
     
-    def create_wind_compass(self, directions: deque) -> Panel:
+    def create_wind_compass(self, directions: RingBuffer) -> Panel:
         """Create ASCII wind compass"""
         if len(directions) < 1:
             return Panel("[dim]No wind direction data[/dim]", title="Wind Direction")
         
         try:
-            current_dir = float(directions[-1])
+            current_dir = directions.last()
             
             # Simple 8-point compass
-            compass_points = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
-            index = int((current_dir + 22.5) / 45) % 8
-            direction = compass_points[index]
+            direction = _COMPASS_8_LUT[int(current_dir * 4) % 1440]
             
             # Create simple compass visualization
             compass = f"""
@@ -509,29 +967,27 @@ Current: {current_dir:.0f}° ({direction})
         except Exception as e:
             return Panel(f"[red]Error: {e}[/red]", title="Wind Direction")
     
-    def create_trend_bars(self, data: deque, title: str, max_bars: int = 10) -> Panel:
+    def create_trend_bars(self, data: RingBuffer, title: str, max_bars: int = 10) -> Panel:
         """Create trend bars visualization"""
         if len(data) < 2:
             return Panel(f"[dim]Collecting {title} data...[/dim]", title=title)
         
         try:
             # Get last few values
-            values = [float(x) for x in list(data)[-max_bars:] if x is not None]
-            if not values:
-                return Panel(f"[dim]No {title} data[/dim]", title=title)
+            values = data.ordered()[-max_bars:]
             
             # Normalize values to 0-1 range
-            min_val, max_val = min(values), max(values)
+            min_val, max_val = values.min(), values.max()
             if max_val == min_val:
-                normalized = [0.5] * len(values)
+                normalized = np.full(len(values), 0.5)
             else:
-                normalized = [(v - min_val) / (max_val - min_val) for v in values]
+                normalized = (values - min_val) / (max_val - min_val)
+            bar_heights = (normalized * 8).astype(int)  # 8 levels
             
             # Create vertical bars
             bars = []
-            for i, norm_val in enumerate(normalized):
-                bar_height = int(norm_val * 8)  # 8 levels
-                bar = "█" * bar_height + "░" * (8 - bar_height)
+            for i, bar_height in enumerate(bar_heights):
+                bar = _TREND_BARS[bar_height]
                 bars.append(f"{values[i]:.1f}\n{bar}")
             
             content = "\n".join(bars[-5:])  # Show last 5 bars
@@ -565,90 +1021,106 @@ Current: {current_dir:.0f}° ({direction})
             Layout(name="spacer", size=1),
             Layout(name="raw_data", size=9)
         )
+        self.draw_static_panels(layout)
         return layout
         
-    def get_parameter_info(self, key: str, value: str):
-        """Get unit and quality info for a parameter"""
-        try:
-            val = float(value)
-            if key.startswith('S'):
-                unit = "m/s"
-                quality = "Good" if 0 <= val <= 50 else "Check"
-            elif key.startswith('T'):
-                unit = "°C"
-                quality = "Good" if -40 <= val <= 60 else "Check"
-            elif key == 'D':
-                unit = "°"
-                quality = "Good" if 0 <= val <= 360 else "Check"
-            elif key in ['U', 'V', 'W']:
-                unit = "m/s"
-                quality = "Good" if -50 <= val <= 50 else "Check"
-            elif key == 'H':
-                unit = "%"
-                quality = "Good" if 0 <= val <= 100 else "Check"
-            elif key == 'P':
-                unit = "hPa"
-                quality = "Good" if 900 <= val <= 1100 else "Check"
-            elif key in ['PI', 'RO']:
-                unit = "°"
-                quality = "Good" if -45 <= val <= 45 else "Check"
-            elif key in ['MD', 'TD']:
-                unit = "°"
-                quality = "Good" if 0 <= val <= 360 else "Check"
-            else:
-                unit = ""
-                quality = "Unknown"
-        except:
-            unit = ""
-            quality = "Invalid"
-        return unit, quality
-
-    def update_sensor_health(self, parameter: str, value: float, is_error: bool = False):
-        """Update sensor health status"""
-        current_time = datetime.datetime.now()
-
-        if parameter not in self.data_quality['sensor_health']:
-            self.data_quality['sensor_health'][parameter] = {
+    def draw_static_panels(self, layout: Layout):
+        """Fill the panels whose content never changes during a session"""
+        # Spacer for layout
+        layout["spacer"].update("")
+
+        # Parameter descriptions panel
+        desc_table = Table(title="Parameter Reference", box=box.SIMPLE, show_header=False)
+        desc_table.add_column("Code", style="cyan", width=3)
+        desc_table.add_column("Description", style="white")
+
+        desc_data = [
+            ("S", "Total wind speed (m/s)"),
+            ("S2", "Alt wind speed calc (m/s)"),
+            ("D", "Wind direction (0-360°)"),
+            ("U", "East-west component (m/s)"),
+            ("V", "North-south component (m/s)"),
+            ("W", "Vertical component (m/s)"),
+            ("T", "Temperature (°C)"),
+            ("H", "Humidity (%)"),
+            ("P", "Pressure (hPa)"),
+            ("PI", "Pitch angle (°)"),
+            ("RO", "Roll angle (°)"),
+            ("MD", "Magnetic heading (°)"),
+            ("TD", "True heading (°)")
+        ]
+
+        for code, desc in desc_data:
+            desc_table.add_row(code, desc)
+
+        layout["parameter_descriptions"].update(
+            StaticRenderable(Panel(desc_table, title="Parameters", border_style="bright_yellow")))
+            
+        # Footer
+        footer_info = []
+        footer_info.append(f"Data: {self.log_filename}")
+        if self.config.save_statistics:
+            footer_info.append(f"Stats: {self.stats_filename}")
+        footer_info.append("Press Ctrl+C to exit")
+        
+        footer_text = " | ".join(footer_info)
+        layout["footer"].update(StaticRenderable(Panel(Text(footer_text, justify="center"), style="dim")))
+        
+    def get_parameter_info(self, key: str, value: Optional[float]):
+        """Get unit and quality info for a parameter; value is None if it was not numeric"""
+        if value is None:
+            return "", "Invalid"
+        info = PARAMETER_RANGES.get(key)
+        if info is None:
+            return "", "Unknown"
+        unit, low, high = info
+        return unit, "Good" if low <= value <= high else "Check"
+
+    def update_sensor_health(self, parameter: str, value: float, is_error: bool = False,
+                             current_time: Optional[float] = None):
+        """Update sensor health status; times are epoch seconds like last_connection_time"""
+        if current_time is None:
+            current_time = time.time()
+
+        sensor = self.data_quality['sensor_health'].get(parameter)
+        if sensor is None:
+            sensor = self.data_quality['sensor_health'][parameter] = {
                 'status': 'Unknown',
                 'error_rate': 0.0,
                 'last_good_reading': None
             }
 
-        sensor = self.data_quality['sensor_health'][parameter]
-
         if is_error:
             self.data_quality['error_count'] += 1
             self.data_quality['last_error_time'] = current_time
             sensor['status'] = 'Error'
         else:
             sensor['last_good_reading'] = current_time
-            if parameter.startswith('T') and value > 100000:
+            # Numeric comparisons first; they rule out the rare states for almost every reading
+            if value > 100000 and parameter.startswith('T'):
                 sensor['status'] = 'Malfunction'
-            elif parameter == 'P' and value == -99.70:
+            elif value == -99.70 and parameter == 'P':
                 sensor['status'] = 'Offline'
             else:
                 sensor['status'] = 'Good'
-
-        # Calculate error rate
-        if self.data_quality['total_readings'] > 0:
-            sensor['error_rate'] = (self.data_quality['error_count'] / self.data_quality['total_readings']) * 100
+        # error_rate is the overall rate and is refreshed with the data quality panel
 
     def get_compass_direction(self, degrees: float) -> str:
         """Convert degrees to compass direction"""
-        directions = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
-                     'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
-        index = int((degrees + 11.25) / 22.5) % 16
-        return directions[index]
+        return _COMPASS_16_LUT[int(degrees * 4) % 1440]
 
-    def calculate_mean_direction(self, directions: list) -> float:
+    def calculate_mean_direction(self, directions: np.ndarray) -> float:
         """Calculate mean wind direction (handling circular nature of degrees)"""
-        import math
-        if not directions:
+        if len(directions) == 0:
             return 0.0
 
+        if numba_installed:
+            return float(_mean_direction_jit(directions))
+
         # Convert to radians and calculate vector components
-        sin_sum = sum(math.sin(math.radians(d)) for d in directions)
-        cos_sum = sum(math.cos(math.radians(d)) for d in directions)
+        radians = np.deg2rad(directions)
+        sin_sum = float(np.sin(radians).sum())
+        cos_sum = float(np.cos(radians).sum())
 
         # Calculate mean direction in radians, then convert to degrees
         mean_rad = math.atan2(sin_sum, cos_sum)
@@ -660,36 +1132,55 @@ Current: {current_dir:.0f}° ({direction})
 
         return mean_deg
 
+    def panel_changed(self, layout: Layout, name: str, key) -> bool:
+        """Return True, remembering key, when a panel's inputs differ from its last drawn frame"""
+        key = (id(layout), key)
+        if self._panel_keys.get(name) == key:
+            return False
+        self._panel_keys[name] = key
+        self._display_dirty = True
+        return True
+        
     def update_display(self, layout: Layout):
         """Enhanced display with more information"""
         # Header with system info
         elapsed = time.time() - self.start_time
         runtime = str(datetime.timedelta(seconds=int(elapsed)))
 
-        header_table = Table.grid(expand=True)
-        header_table.add_column(justify="left", ratio=1)
-        header_table.add_column(justify="center", ratio=1)
-        header_table.add_column(justify="right", ratio=1)
-
-        # System metrics
-        memory_usage = f"{sys.getsizeof(self.data_points) / 1024:.1f} KB"
-
-        header_table.add_row(
-            "Trisonica Linux Logger",
-            f"Runtime: {runtime}",
-            f"Points: {self.point_count:,}"
-        )
-        header_table.add_row(
-            f"Update Rate: {self.update_rate:.1f} Hz",
-            f"Memory: {memory_usage}",
-            f"Log: {os.path.basename(self.log_path)}"
-        )
-
-        layout["header"].update(Panel(header_table, title="System Status", style="bold blue"))
+        # System metrics; memory changes slowly, so it is only re-measured every few seconds
+        if elapsed - self._memory_checked_at >= MEMORY_CHECK_INTERVAL:
+            memory_kb = (self.arrival_times.view().nbytes + sys.getsizeof(self.recent_points)) / 1024
+            self._memory_usage = f"{memory_kb:.1f} KB"
+            self._memory_checked_at = elapsed
+        memory_usage = self._memory_usage
+        update_rate = f"{self.update_rate:.1f}"
+
+        if self.panel_changed(layout, "header", (runtime, self.point_count, update_rate, memory_usage)):
+            header_table = Table.grid(expand=True)
+            header_table.add_column(justify="left", ratio=1)
+            header_table.add_column(justify="center", ratio=1)
+            header_table.add_column(justify="right", ratio=1)
+
+            header_table.add_row(
+                "Trisonica Linux Logger",
+                f"Runtime: {runtime}",
+                f"Points: {self.point_count:,}"
+            )
+            header_table.add_row(
+                f"Update Rate: {update_rate} Hz",
+                f"Memory: {memory_usage}",
+                f"Log: {os.path.basename(self.log_path)}"
+            )
+
+            layout["header"].update(Panel(header_table, title="System Status", style="bold blue"))
+        
+        # The data panels below only change when new readings arrive
+        if not self.panel_changed(layout, "data", (self.point_count, self.data_quality['total_readings'])):
+            return
         
         # Combined comprehensive data and statistics table
-        if self.data_points and self.stats:
-            latest = self.data_points[-1]
+        if self.recent_points and self.stats:
+            latest = self.recent_points[-1]
 
             # Comprehensive stats table with current values, units, quality, and statistics
             comprehensive_table = Table(box=box.ROUNDED)
@@ -705,7 +1196,7 @@ Current: {current_dir:.0f}° ({direction})
             # Combine current values with statistics
             for key in latest.parsed_data.keys():
                 value = latest.parsed_data[key]
-                unit, quality = self.get_parameter_info(key, value)
+                unit, quality = self.get_parameter_info(key, latest.parsed_floats.get(key))
 
                 # Get statistics if available
                 if key in self.stats:
@@ -734,9 +1225,9 @@ Current: {current_dir:.0f}° ({direction})
                     )
 
             layout["current_data"].update(Panel(comprehensive_table, title="Live Data & Statistics"))
-        elif self.data_points:
+        elif self.recent_points:
             # Fallback to simple current data if no statistics yet
-            latest = self.data_points[-1]
+            latest = self.recent_points[-1]
             data_table = Table(title="Current Measurements", box=box.ROUNDED)
             data_table.add_column("Parameter", style="cyan", width=12)
             data_table.add_column("Value", style="green", width=10)
@@ -744,7 +1235,7 @@ Current: {current_dir:.0f}° ({direction})
             data_table.add_column("Quality", style="yellow", width=10)
 
             for key, value in latest.parsed_data.items():
-                unit, quality = self.get_parameter_info(key, value)
+                unit, quality = self.get_parameter_info(key, latest.parsed_floats.get(key))
                 data_table.add_row(key, value, unit, quality)
 
             layout["current_data"].update(Panel(data_table, title="Current Measurements"))
@@ -752,41 +1243,40 @@ Current: {current_dir:.0f}° ({direction})
             layout["current_data"].update(Panel("Waiting for data...", title="Current Measurements"))
             
         # Raw data display (now on right side)
-        if self.data_points and self.config.show_raw_data:
+        if self.recent_points and self.config.show_raw_data:
             raw_lines = []
-            for dp in list(self.data_points)[-5:]:
+            for dp in self.recent_points:
                 timestamp = dp.timestamp.strftime('%H:%M:%S.%f')[:-3]
                 # Use full raw data without truncation
                 raw_data = dp.raw_data
                 raw_lines.append(f"{timestamp}: {raw_data}")
 
-            raw_text = "\n".join(raw_lines)
+            # Text skips markup parsing and highlighting on every refresh; serial data is not markup anyway
+            raw_text = Text("\n".join(raw_lines))
             layout["raw_data"].update(Panel(raw_text, title="Raw Data Stream", border_style="bright_cyan"))
         else:
-            if not self.data_points:
+            if not self.recent_points:
                 layout["raw_data"].update(Panel("No data received yet", title="Raw Data Stream", border_style="bright_cyan"))
             else:
                 layout["raw_data"].update(Panel("Raw data display disabled", title="Raw Data Stream", border_style="bright_cyan"))
 
-        # Spacer for layout
-        layout["spacer"].update("")
-
         # Wind statistics panel (recent 300 measurements)
         if len(self.viz_data['wind_speed']) > 0 and len(self.viz_data['wind_direction']) > 0:
-            current_speed = self.viz_data['wind_speed'][-1]
-            current_dir = self.viz_data['wind_direction'][-1]
+            current_speed = self.viz_data['wind_speed'].last()
+            current_dir = self.viz_data['wind_direction'].last()
 
             # Get compass direction
             compass_dir = self.get_compass_direction(current_dir)
 
             # Calculate recent 1000-measurement statistics
             if len(self.recent_wind_speeds) > 0 and len(self.recent_wind_directions) > 0:
-                recent_speeds = list(self.recent_wind_speeds)
-                recent_dirs = list(self.recent_wind_directions)
+                # Views over the ring buffers; the reductions below run in NumPy
+                recent_speeds = self.recent_wind_speeds.view()
+                recent_dirs = self.recent_wind_directions.view()
 
-                recent_min = min(recent_speeds)
-                recent_max = max(recent_speeds)
-                recent_avg = sum(recent_speeds) / len(recent_speeds)
+                recent_min = float(recent_speeds.min())
+                recent_max = float(recent_speeds.max())
+                recent_avg = float(recent_speeds.mean())
                 recent_count = len(recent_speeds)
 
                 # Calculate mean direction
@@ -796,11 +1286,10 @@ Current: {current_dir:.0f}° ({direction})
                 # Calculate gust difference (max - avg)
                 gust_diff = recent_max - recent_avg
 
-                # Calculate direction variability (range of directions)
-                dir_range = max(recent_dirs) - min(recent_dirs)
+                # Calculate direction variability (range of directions) in one NumPy call
+                dir_range = float(np.ptp(recent_dirs))
                 # Handle wraparound case (e.g., 350° to 10° = 20° range, not 340°)
-                if dir_range > 180:
-                    dir_range = 360 - dir_range
+                dir_range = min(dir_range, 360 - dir_range)
             else:
                 recent_min = recent_max = recent_avg = current_speed
                 recent_count = 1
@@ -820,34 +1309,20 @@ Mean Dir: {mean_dir:.0f}° ({mean_compass})
 Gust: +{gust_diff:.2f} m/s
 Dir Range: {dir_range:.0f}°"""
 
-            layout["wind_viz"].update(Panel(wind_content, title="Wind Speed", border_style="bright_blue"))
-        else:
+            if self.panel_changed(layout, "wind_viz", wind_content):
+                layout["wind_viz"].update(Panel(Text(wind_content), title="Wind Speed", border_style="bright_blue"))
+        elif self.panel_changed(layout, "wind_viz", None):
             layout["wind_viz"].update(Panel("Collecting wind data...\n\nWaiting for:\n• Wind speed (S/S2)\n• Wind direction (D)", title="Wind Speed", border_style="dim"))
 
         # Data Quality Dashboard
         error_rate = (self.data_quality['error_count'] / max(1, self.data_quality['total_readings'])) * 100
 
-        # Create compact sensor status display
-        sensor_status_lines = []
-        key_sensors = ['S', 'T', 'P', 'D', 'H']
-        for sensor in key_sensors:
-            if sensor in self.data_quality['sensor_health']:
-                health = self.data_quality['sensor_health'][sensor]
-                status = health['status']
-
-                # Color code status
-                if status == 'Good':
-                    status_display = "[green]●[/green] Good"
-                elif status == 'Error':
-                    status_display = "[red]●[/red] Error"
-                elif status == 'Malfunction':
-                    status_display = "[red]●[/red] Broken"
-                elif status == 'Offline':
-                    status_display = "[yellow]●[/yellow] Offline"
-                else:
-                    status_display = "[dim]●[/dim] Unknown"
-
-                sensor_status_lines.append(f"{sensor:>2}: {status_display}")
+        # Create compact sensor status display; each (sensor, status) line is formatted once
+        sensor_health = self.data_quality['sensor_health']
+        for health in sensor_health.values():
+            health['error_rate'] = error_rate
+        sensor_status_lines = [_sensor_status_line(sensor, sensor_health[sensor]['status'])
+                               for sensor in KEY_SENSORS if sensor in sensor_health]
 
         # Combine sensor status and summary
         quality_content = "\n".join(sensor_status_lines)
@@ -856,44 +1331,9 @@ Dir Range: {dir_range:.0f}°"""
 Error Rate: {error_rate:.1f}%
 Total: {self.data_quality['total_readings']:,} | Errors: {self.data_quality['error_count']}"""
 
-        border_color = "bright_green" if error_rate < 1.0 else "bright_yellow" if error_rate < 5.0 else "bright_red"
-        layout["alerts"].update(Panel(quality_content, title="Data Quality", border_style=border_color))
-
-        # Parameter descriptions panel
-        desc_table = Table(title="Parameter Reference", box=box.SIMPLE, show_header=False)
-        desc_table.add_column("Code", style="cyan", width=3)
-        desc_table.add_column("Description", style="white")
-
-        desc_data = [
-            ("S", "Total wind speed (m/s)"),
-            ("S2", "Alt wind speed calc (m/s)"),
-            ("D", "Wind direction (0-360°)"),
-            ("U", "East-west component (m/s)"),
-            ("V", "North-south component (m/s)"),
-            ("W", "Vertical component (m/s)"),
-            ("T", "Temperature (°C)"),
-            ("H", "Humidity (%)"),
-            ("P", "Pressure (hPa)"),
-            ("PI", "Pitch angle (°)"),
-            ("RO", "Roll angle (°)"),
-            ("MD", "Magnetic heading (°)"),
-            ("TD", "True heading (°)")
-        ]
-
-        for code, desc in desc_data:
-            desc_table.add_row(code, desc)
-
-        layout["parameter_descriptions"].update(Panel(desc_table, title="Parameters", border_style="bright_yellow"))
-            
-        # Footer
-        footer_info = []
-        footer_info.append(f"Data: {self.log_filename}")
-        if self.config.save_statistics:
-            footer_info.append(f"Stats: {self.stats_filename}")
-        footer_info.append("Press Ctrl+C to exit")
-        
-        footer_text = " | ".join(footer_info)
-        layout["footer"].update(Panel(Align.center(footer_text), style="dim"))
+        border_color = _QUALITY_BORDERS[(error_rate >= 1.0) + (error_rate >= 5.0)]
+        if self.panel_changed(layout, "alerts", (quality_content, border_color)):
+            layout["alerts"].update(Panel(quality_content, title="Data Quality", border_style=border_color))
         
     def run(self):
         """Main execution with Rich interface"""
@@ -901,26 +1341,60 @@ Total: {self.data_quality['total_readings']:,} | Errors: {self.data_quality['err
             return False
             
         layout = self.create_layout()
+        reader = stats_saver = None
         
         try:
-            with Live(layout, refresh_per_second=20, screen=True) as live:
+            # Repainted by hand, only on frames where a panel changed
+            with Live(layout, auto_refresh=False, screen=True) as live:
                 self.running = True
+                self._shutdown_r, self._shutdown_w = os.pipe()
+                # Serial reads run on their own thread so display work never stalls them
+                reader = threading.Thread(target=self.serial_reader, name="serial-reader", daemon=True)
+                reader.start()
+                # Periodic statistics snapshots are written off the acquisition loop
+                stats_saver = threading.Thread(target=self.statistics_saver, name="stats-saver", daemon=True)
+                stats_saver.start()
                 while self.running:
-                    data_point = self.read_serial_data()
-                    if data_point:
-                        self.point_count += 1
-                        self.data_points.append(data_point)
-                        
-                        # Save statistics periodically
-                        if self.point_count % 100 == 0:
-                            self.save_final_statistics()
-                            
-                    self.update_display(layout)
-                    time.sleep(UPDATE_INTERVAL)
+                    # Sleep until the reader queues lines or the next frame is due
+                    self._data_ready.wait(max(0.0, self._last_render + UPDATE_INTERVAL - time.monotonic()))
+                    self._data_ready.clear()
+                    self.process_queued_lines()
+                    # A sensor that pauses leaves rows in the buffer; the loop wakes at least every frame
+                    self.flush_stale_rows()
+                    if self.log_file.error is not None:
+                        # The data log cannot be written (disk full, drive removed); stop rather
+                        # than keep acquiring readings that would be missing from it
+                        break
+                    
+                    # Rebuild panels at the display rate rather than once per reading
+                    now = time.monotonic()
+                    if now - self._last_render >= UPDATE_INTERVAL:
+                        self.update_display(layout)
+                        self._last_render = now
+                        # Idle frames (no new readings, same runtime second) cost no terminal output
+                        if self._display_dirty:
+                            self._display_dirty = False
+                            live.refresh()
                     
         except KeyboardInterrupt:
             pass
         finally:
+            self.running = False
+            self.wake_reader()
+            if reader is not None:
+                reader.join(timeout=2)
+            self._stats_stop.set()
+            if stats_saver is not None:
+                stats_saver.join(timeout=2)
+            if self._shutdown_w is not None:
+                shutdown_fds = (self._shutdown_r, self._shutdown_w)
+                self._shutdown_r = self._shutdown_w = None
+                for fd in shutdown_fds:
+                    os.close(fd)
+            # Log readings that were queued but not yet processed
+            self.process_queued_lines()
+            if self._stats_dirty:
+                self.save_final_statistics()
             self.cleanup()
             
         return True
@@ -932,8 +1406,13 @@ Total: {self.data_quality['total_readings']:,} | Errors: {self.data_quality['err
             self.console.print("[CLEANUP] Serial port closed", style="green")
             
         if self.log_file and not self.log_file.closed:
+            self.flush_csv_rows()
             self.log_file.close()
-            self.console.print(f"[CLEANUP] Data log saved: {self.log_path}", style="green")
+            if self.log_file.error is not None:
+                self.console.print(f"[ERROR] Writing the data log failed: {self.log_file.error}", style="bold red")
+                self.console.print(f"[ERROR] Rows from that point on may be missing from {self.log_path}", style="red")
+            else:
+                self.console.print(f"[CLEANUP] Data log saved: {self.log_path}", style="green")
             
         if self.stats_file and not self.stats_file.closed:
             self.stats_file.close()
@@ -126,11 +126,10 @@ install_dependencies() {
     source "$VENV_DIR/bin/activate"
     
     # Install required packages
-    pip install pyserial rich psutil
+    pip install pyserial rich psutil numpy
     
     # Optional packages for advanced features and visualization
     pip install matplotlib numpy pandas || print_warning "Optional visualization packages failed to install"
-    pip install windrose || print_warning "Windrose package failed to install (optional for wind plots)"
     
     print_status "Dependencies installed"
 }
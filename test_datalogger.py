@@ -6,14 +6,19 @@ Tests the updated functionality without requiring actual hardware
 
 import sys
 import os
+import io
+import csv
+import errno
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
 # Add the current directory to path to import datalogger
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from datalogger import TrisonicaDataLoggerLinux, Config
+from datalogger import TrisonicaDataLoggerLinux, Config, BatchedLogWriter, CSV_FLUSH_INTERVAL, _COMPASS_8_LUT
 
 def test_datalogger_initialization():
     """Test that the datalogger initializes correctly"""
@@ -62,6 +67,27 @@ def test_data_parsing():
 
         print("[PASS] Data parsing test passed")
 
+def test_schema_specialized_parsing():
+    """Test that a stable line format switches to the generated parser and back"""
+    print("Testing schema-specialized parsing...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        test_line = "S 12.34,S2 11.89,D 180,T 23.5"
+        for _ in range(60):
+            parsed = logger.parse_data_line(test_line)
+        assert logger._schema_parser is not None
+        assert parsed == {'S': '12.34', 'S2': '11.89', 'D': '180', 'T': '23.5'}
+
+        # A new parameter falls back to the generic parser
+        parsed = logger.parse_data_line("S 12.34,S2 11.89,D 180,T 23.5,H 45.2")
+        assert parsed['H'] == '45.2'
+        assert logger._schema_parser is None
+
+        print("[PASS] Schema-specialized parsing test passed")
+
 def test_csv_column_management():
     """Test dynamic CSV column management"""
     print("Testing CSV column management...")
@@ -84,6 +110,38 @@ def test_csv_column_management():
 
         print("[PASS] CSV column management test passed")
 
+def test_generated_row_formatter():
+    """Test that CSV rows from the generated formatter match csv.writer output"""
+    print("Testing generated CSV row formatter...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        readings = [
+            {'S': '1.50', 'D': '180'},
+            {'S': '1.60'},                             # Missing column
+            {'S': '1.70', 'D': '190', 'T': '23.5'},    # New column mid-run
+            {'T': '23.6', 'S': '1,80', 'D': '"200"'},  # Values that need quoting
+        ]
+        expected = io.StringIO()
+        writer = csv.writer(expected, lineterminator='\n')
+        writer.writerow(['timestamp', 'S', 'D'])  # The header is written once, with the first columns
+        columns = ['S', 'D']
+        for i, parsed in enumerate(readings):
+            ts_ns = 1_700_000_000 * 10**9 + i * 1000
+            columns += [key for key in parsed if key not in columns]
+            writer.writerow([logger.format_timestamp(ts_ns)] + [parsed.get(key, '') for key in columns])
+            logger.update_csv_columns(parsed)
+            logger.write_csv_row(ts_ns, parsed)
+        logger.flush_csv_rows()
+        logger.log_file.close()
+
+        with open(logger.log_path, newline='') as f:
+            assert f.read() == expected.getvalue()
+
+        print("[PASS] Generated row formatter test passed")
+
 def test_statistics_calculation():
     """Test statistics calculation"""
     print("Testing statistics calculation...")
@@ -106,6 +164,223 @@ def test_statistics_calculation():
 
         print("[PASS] Statistics calculation test passed")
 
+def test_rolling_statistics_window():
+    """Test that mean/std track only the last 100 values"""
+    print("Testing rolling statistics window...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        # 100 readings of 1.0 followed by 100 readings of 3.0
+        for val in [1.0] * 100 + [3.0] * 100:
+            logger.calculate_statistics('T', val)
+
+        stats = logger.stats['T']
+        assert stats.count == 200
+        assert stats.min_val == 1.0
+        assert stats.max_val == 3.0
+        assert abs(stats.mean_val - 3.0) < 1e-9  # Only the 3.0 readings remain in the window
+        assert stats.std_dev < 1e-6
+
+        print("[PASS] Rolling statistics window test passed")
+
+def test_statistics_snapshot_consistency():
+    """Test that snapshots taken during updates never mix fields from different samples"""
+    print("Testing statistics snapshots under concurrent updates...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+        done = threading.Event()
+
+        def snapshots():
+            while not done.is_set():
+                logger.save_final_statistics()
+
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads often so an unlocked update would be seen mid-way
+        snapshot_thread = threading.Thread(target=snapshots)
+        snapshot_thread.start()
+        try:
+            # Reading n is sample n, so a consistent row has max == count and the window's mean
+            for n in range(1, 20001):
+                logger.calculate_statistics('T', float(n))
+        finally:
+            done.set()
+            snapshot_thread.join()
+            sys.setswitchinterval(old_interval)
+        logger.stats_file.close()
+
+        with open(logger.stats_path, newline='') as f:
+            rows = [row for row in csv.DictReader(f) if row['parameter'] == 'T']
+        assert rows
+        for row in rows:
+            count = int(row['count'])
+            expected_mean = (count + 1) / 2 if count < 100 else count - 49.5
+            assert float(row['min']) == 1.0
+            assert float(row['max']) == count, row
+            assert abs(float(row['mean']) - expected_mean) < 1e-3, row
+
+        print(f"[PASS] {len(rows)} statistics snapshots were consistent")
+
+def test_update_rate_from_bulk_reads():
+    """Test that lines sharing one read's arrival time all count toward the update rate"""
+    print("Testing update rate with bulk reads...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        # 20 lines per read, one read every 0.1 s for 2 s: 200 lines per second
+        start_ns = 1_700_000_000 * 10**9
+        logger.last_update = start_ns / 1e9
+        for read in range(1, 21):
+            for _ in range(20):
+                logger.process_line(b"S 1.50 D 180 T 23.5", start_ns + read * 100_000_000)
+
+        assert abs(logger.update_rate - 200.0) < 0.01
+
+        print("[PASS] Update rate test passed")
+
+def test_idle_stream_rows_reach_disk():
+    """Test that buffered rows are written after CSV_FLUSH_INTERVAL even when no new line arrives"""
+    print("Testing row flush on an idle stream...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        for i in range(30):
+            logger.process_line(b"S 1.50 D 180", 1_700_000_000 * 10**9 + i)
+        logger.flush_stale_rows()
+        assert len(logger._row_buf) == 30  # Not due yet
+
+        # The sensor goes quiet; the run loop keeps calling flush_stale_rows every frame
+        logger._last_flush -= CSV_FLUSH_INTERVAL + 0.1
+        logger.flush_stale_rows()
+        assert not logger._row_buf
+
+        deadline = time.monotonic() + 2.0
+        while True:
+            with open(logger.log_path) as f:
+                lines = f.read().splitlines()
+            if len(lines) == 31 or time.monotonic() > deadline:
+                break
+            time.sleep(0.01)
+        assert len(lines) == 31  # Header and every buffered row, without closing the log
+        logger.log_file.close()
+
+        print("[PASS] Idle stream flush test passed")
+
+def test_batched_log_writer():
+    """Test that batches reach the file in submission order once the writer is closed"""
+    print("Testing batched log writer...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "batched.csv")
+        writer = BatchedLogWriter(path)
+        expected = [b"timestamp,S\n"]
+        writer.write(expected[0])
+        for batch in range(50):
+            rows = [f"{batch},{row}\n".encode('ascii') for row in range(20)]
+            writer.writelines(rows)
+            expected.extend(rows)
+        writer.close()
+        writer.close()  # A second close is a no-op
+
+        assert writer.closed
+        assert writer.error is None
+        with open(path, 'rb') as f:
+            assert f.read() == b''.join(expected)
+
+        print("[PASS] Batched log writer test passed")
+
+def test_log_write_failure():
+    """Test that a failed data log write is recorded for the run loop instead of dropping readings"""
+    print("Testing data log write failure...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        def full_disk(batch):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        logger.log_file._write_batch = full_disk
+
+        assert logger.process_line(b"S 1.50 D 180", 1_700_000_000 * 10**9) is not None
+        logger.flush_csv_rows()
+        deadline = time.monotonic() + 2.0
+        while logger.log_file.error is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert logger.log_file.error.errno == errno.ENOSPC
+
+        # Later readings still reach the display and statistics; the run loop stops on error
+        assert logger.process_line(b"S 2.50 D 190", 1_700_000_001 * 10**9) is not None
+        logger.flush_csv_rows()
+        assert logger.stats['S'].count == 2
+        logger.log_file.close()
+
+        print("[PASS] Data log write failure test passed")
+
+def test_log_files_after_close():
+    """Test that rows are not duplicated by a re-entrant flush and the stats file holds only what was written"""
+    print("Testing log files after close...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir, save_statistics=True)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        for i in range(10):
+            logger.process_line(f"S {i}.5 D 180".encode('ascii'), 1_700_000_000 * 10**9 + i)
+
+        # A signal handler flushing again from inside the submit must not resubmit the same rows
+        submit = logger.log_file.writelines
+        interrupted = []
+        def interrupted_submit(rows):
+            if not interrupted:
+                interrupted.append(True)
+                logger.flush_csv_rows()
+            submit(rows)
+        logger.log_file.writelines = interrupted_submit
+        logger.flush_csv_rows()
+        logger.save_final_statistics()
+        logger.log_file.close()
+        logger.stats_file.close()
+
+        with open(logger.log_path) as f:
+            assert len(f.read().splitlines()) == 11  # Header and one row per line
+        with open(logger.stats_path, 'rb') as f:
+            content = f.read()
+        assert b'\0' not in content
+        assert content.count(b'\n') == 3  # Header and one line each for S and D
+
+        print("[PASS] Log files after close test passed")
+
+def test_compass_lookup():
+    """Test the quarter-degree compass tables against the arithmetic they replaced"""
+    print("Testing compass direction lookup...")
+
+    points_16 = ['N', 'NNE', 'NE', 'ENE', 'E', 'ESE', 'SE', 'SSE',
+                 'S', 'SSW', 'SW', 'WSW', 'W', 'WNW', 'NW', 'NNW']
+    points_8 = ['N', 'NE', 'E', 'SE', 'S', 'SW', 'W', 'NW']
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config = Config(log_dir=temp_dir)
+        logger = TrisonicaDataLoggerLinux(config)
+
+        edges = [0.0, 11.2499, 11.25, 22.5, 33.75, 348.7499, 348.75, 359.99, 360.0]
+        sweep = [i / 100 for i in range(36001)]
+        for degrees in edges + sweep:
+            assert logger.get_compass_direction(degrees) == points_16[int((degrees + 11.25) / 22.5) % 16], degrees
+            assert _COMPASS_8_LUT[int(degrees * 4) % 1440] == points_8[int((degrees + 22.5) / 45) % 8], degrees
+
+        assert logger.get_compass_direction(11.25) == 'NNE'
+        assert logger.get_compass_direction(348.75) == 'N'
+        assert logger.get_compass_direction(360.0) == 'N'
+
+        print("[PASS] Compass lookup test passed")
+
 def test_layout_creation():
     """Test that the layout can be created"""
     print("Testing layout creation...")
@@ -133,8 +408,18 @@ def main():
     try:
         test_datalogger_initialization()
         test_data_parsing()
+        test_schema_specialized_parsing()
         test_csv_column_management()
+        test_generated_row_formatter()
         test_statistics_calculation()
+        test_rolling_statistics_window()
+        test_statistics_snapshot_consistency()
+        test_update_rate_from_bulk_reads()
+        test_idle_stream_rows_reach_disk()
+        test_batched_log_writer()
+        test_log_write_failure()
+        test_log_files_after_close()
+        test_compass_lookup()
         test_layout_creation()
 
         print(f"\nAll tests passed! Linux datalogger is ready to use.")
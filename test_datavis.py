@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Test script for the Trisonica data visualizer
+Tests log parsing and plotting without requiring real log files
+"""
+
+import sys
+import os
+import csv
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+# Add the current directory to path to import DataVis
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import DataVis
+
+def test_csv_stray_value_late_in_file():
+    """Test that a non-numeric value past the type inference window does not lose the file"""
+    print("Testing CSV parsing with a late stray value...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "TrisonicaData_test.csv")
+        with open(path, "w") as f:
+            f.write("timestamp,S,D\n")
+            for i in range(12000):
+                speed = "ERR" if i == 11000 else "1.50"
+                f.write(f"2025-01-01T00:{i // 3600:02d}:{i // 60 % 60:02d}.{i % 60:06d},{speed},180\n")
+
+        df, _ = DataVis.parse_csv_log_with_stats(path)
+
+        assert df is not None
+        assert len(df) == 12000
+        assert df['S'].isna().sum() == 1  # Only the stray value is dropped
+
+        print("[PASS] Late stray value test passed")
+
+def _write_log(temp_dir, name, data):
+    """Write raw bytes to a log file in temp_dir and return its path"""
+    path = os.path.join(temp_dir, name)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+def _expected_frame(timestamps, columns, index_name='Timestamp'):
+    """Build the float64 frame, indexed by time, that the log parsers return"""
+    index = pd.DatetimeIndex(pd.to_datetime(timestamps), name=index_name)
+    return pd.DataFrame({key: pd.Series(values, dtype='float64', index=index) for key, values in columns.items()})
+
+def test_tagged_log_parsing():
+    """Test the tagged log parser on line endings, mode lines, units, truncation and empty files"""
+    print("Testing tagged log parsing...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # CRLF line endings
+        path = _write_log(temp_dir, "crlf.log",
+                          b"[2025-01-01 00:00:00.000], S 1.50, D 180, T 23.5\r\n"
+                          b"[2025-01-01 00:00:01.000], S 2.00, D 190, T 23.6\r\n")
+        pd.testing.assert_frame_equal(DataVis.parse_tagged_log(path), _expected_frame(
+            ["2025-01-01 00:00:00", "2025-01-01 00:00:01"],
+            {'S': [1.5, 2.0], 'D': [180.0, 190.0], 'T': [23.5, 23.6]}))
+
+        # Sensor mode messages are skipped
+        path = _write_log(temp_dir, "mode.log",
+                          b"[2025-01-01 00:00:00.000], S 1.50, D 180\n"
+                          b"[2025-01-01 00:00:00.500], Mode 2 overriding settings\n"
+                          b"[2025-01-01 00:00:01.000], S 2.00, D 190\n")
+        pd.testing.assert_frame_equal(DataVis.parse_tagged_log(path), _expected_frame(
+            ["2025-01-01 00:00:00", "2025-01-01 00:00:01"],
+            {'S': [1.5, 2.0], 'D': [180.0, 190.0]}))
+
+        # A unit after the value and space-separated pairs are read as key/value pairs
+        path = _write_log(temp_dir, "units.log",
+                          b"[2025-01-01 00:00:00.000], S 1.50 m/s, T 23.5 C, D 180\n"
+                          b"[2025-01-01 00:00:01.000], S 2.00 D 190 T 23.6\n")
+        pd.testing.assert_frame_equal(DataVis.parse_tagged_log(path), _expected_frame(
+            ["2025-01-01 00:00:00", "2025-01-01 00:00:01"],
+            {'S': [1.5, 2.0], 'T': [23.5, 23.6], 'D': [180.0, 190.0]}))
+
+        # A final line cut off mid-pair keeps its complete pairs; one cut off in the timestamp is dropped
+        path = _write_log(temp_dir, "truncated.log",
+                          b"[2025-01-01 00:00:00.000], S 1.50, D 180\n"
+                          b"[2025-01-01 00:00:01.000], S 2.00, D")
+        pd.testing.assert_frame_equal(DataVis.parse_tagged_log(path), _expected_frame(
+            ["2025-01-01 00:00:00", "2025-01-01 00:00:01"],
+            {'S': [1.5, 2.0], 'D': [180.0, float('nan')]}))
+        path = _write_log(temp_dir, "truncated_ts.log",
+                          b"[2025-01-01 00:00:00.000], S 1.50, D 180\n"
+                          b"[2025-01-01 00:00:0")
+        pd.testing.assert_frame_equal(DataVis.parse_tagged_log(path), _expected_frame(
+            ["2025-01-01 00:00:00"], {'S': [1.5], 'D': [180.0]}))
+
+        # Empty file
+        assert DataVis.parse_tagged_log(_write_log(temp_dir, "empty.log", b"")) is None
+
+        print("[PASS] Tagged log parsing test passed")
+
+def test_json_log_parsing():
+    """Test the JSON log parser with a malformed payload and a missing key"""
+    print("Testing JSON log parsing...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "json.csv")
+        with open(path, "w", newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(["timestamp", "parsed_json"])
+            writer.writerow(["2025-01-01 00:00:00", '{"S": 1.5, "D": 180, "T": "23.5", "status": "ok"}'])
+            writer.writerow(["2025-01-01 00:00:01", '{"S": 2.0, "D": 19'])  # Malformed, dropped
+            writer.writerow(["2025-01-01 00:00:02", '{"S": 2.5, "D": 200}'])  # No T
+            writer.writerow(["2025-01-01 00:00:03", '{"S": "ERR", "D": 210, "T": 23.7}'])
+
+        pd.testing.assert_frame_equal(DataVis.parse_json_log(path), _expected_frame(
+            ["2025-01-01 00:00:00", "2025-01-01 00:00:02", "2025-01-01 00:00:03"],
+            {'S': [1.5, 2.5, float('nan')], 'D': [180.0, 200.0, 210.0], 'T': [23.5, float('nan'), 23.7]},
+            index_name='timestamp'))
+
+        print("[PASS] JSON log parsing test passed")
+
+def test_streamed_statistics_match_full_load():
+    """Test that chunk-merged streaming statistics equal those of the fully loaded file"""
+    print("Testing streamed CSV statistics...")
+
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "TrisonicaData_stream.csv")
+        with open(path, "w") as f:
+            f.write("timestamp,S,P,T\n")
+            for i in range(5000):
+                speed = "ERR" if i % 997 == 0 else f"{rng.gamma(2.0, 1.5):.4f}"
+                pressure = f"{1013.25 + rng.normal(0, 0.05):.5f}"  # Large mean, tiny spread
+                temp = "" if i % 13 == 0 else f"{rng.normal(20, 3):.3f}"
+                f.write(f"2025-01-01T{i // 3600:02d}:{i // 60 % 60:02d}:{i % 60:02d},{speed},{pressure},{temp}\n")
+
+        full_df = DataVis.parse_csv_log(path)
+        _, streamed = DataVis.stream_csv_log(path, chunksize=777)  # Uneven chunks exercise the merge
+
+        for col in ('S', 'P', 'T'):
+            expected = DataVis._array_stats(full_df[col].to_numpy(dtype=np.float64, na_value=np.nan))
+            actual = streamed[col]
+            assert actual['count'] == expected['count'], col
+            for key in ('min', 'max', 'mean', 'std'):
+                assert abs(actual[key] - expected[key]) <= 1e-9 * max(1.0, abs(expected[key])), (col, key)
+
+        print("[PASS] Streamed statistics test passed")
+
+def test_wind_rose_bins():
+    """Test wind rose speed and direction binning at the class and sector edges"""
+    print("Testing wind rose binning...")
+
+    samples = [
+        (0.5, 0.0, 0, 0),      # North
+        (0.5, 360.0, 0, 0),    # 360 is north too
+        (1.0, 348.75, 1, 0),   # Lower edges belong to the bin above them
+        (2.5, 11.24, 2, 0),
+        (2.5, 11.25, 2, 1),    # NNE starts half a sector past north
+        (6.0, 90.0, 4, 4),     # East
+        (9.99, 270.0, 5, 12),  # West
+        (10.0, 337.5, 6, 15),  # NNW
+        (20.0, 180.0, 7, 8),   # South, open-ended top speed class
+    ]
+    speed = np.array([s for s, _, _, _ in samples])
+    direction = np.array([d for _, d, _, _ in samples])
+    expected = np.zeros((len(DataVis.WIND_ROSE_SPEED_BINS) - 1, DataVis.WIND_ROSE_SECTORS))
+    for _, _, speed_bin, sector in samples:
+        expected[speed_bin, sector] += 1
+
+    np.testing.assert_array_equal(DataVis._wind_rose_counts(speed, direction), expected)
+
+    print("[PASS] Wind rose binning test passed")
+
+def test_plots_with_no_rows():
+    """Test that a header-only CSV still produces its plots instead of raising"""
+    print("Testing plotting with no data rows...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "TrisonicaData_empty.csv")
+        with open(path, "w") as f:
+            f.write("timestamp,S,D,T\n")
+
+        df, column_stats = DataVis.parse_csv_log_with_stats(path)
+        assert df is not None
+        assert len(df) == 0
+
+        summary_path = os.path.join(temp_dir, "summary.png")
+        DataVis.save_summary_plot(df, summary_path)
+        times, plot_arrays = DataVis.to_plot_arrays(df)
+        series = [(values, column, column, os.path.join(temp_dir, f"{column}.png"), column_stats.get(column))
+                  for column, values in plot_arrays.items()]
+        DataVis.save_time_series_plots(times, series)
+        DataVis.wait_for_saves()
+
+        assert os.path.exists(summary_path)
+
+        print("[PASS] Empty data plotting test passed")
+
+def test_format_cache():
+    """Test that detected formats are cached in the user cache dir and read errors are never cached"""
+    print("Testing log format cache...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = _write_log(temp_dir, "TrisonicaData.csv", b"timestamp,S,D\n1,2.0,90\n")
+        unreadable = os.path.join(temp_dir, "not_a_file.csv")
+        os.mkdir(unreadable)  # Opening it raises, like a log without read permission
+
+        assert DataVis.detect_log_format(csv_path) == 'csv'
+        assert DataVis.detect_log_format(unreadable) == 'unknown'
+        assert os.path.abspath(csv_path) in DataVis._load_format_cache()
+        assert os.path.abspath(unreadable) not in DataVis._load_format_cache()
+
+        original_cache_file = DataVis.FORMAT_CACHE_FILE
+        DataVis.FORMAT_CACHE_FILE = os.path.join(temp_dir, "cache", "trisonica", "format_cache.json")
+        try:
+            DataVis.save_format_cache()
+            assert os.path.exists(DataVis.FORMAT_CACHE_FILE)
+        finally:
+            DataVis.FORMAT_CACHE_FILE = original_cache_file
+
+        print("[PASS] Log format cache test passed")
+
+def test_jobs_must_be_positive():
+    """Test that --jobs below 1 is rejected as a usage error"""
+    print("Testing --jobs validation...")
+
+    original_argv = sys.argv
+    for jobs in ("0", "-2"):
+        sys.argv = ["DataVis.py", "--jobs", jobs, "unused.csv"]
+        try:
+            DataVis.main()
+        except SystemExit as e:
+            assert e.code == 2
+        else:
+            raise AssertionError(f"--jobs {jobs} was accepted")
+        finally:
+            sys.argv = original_argv
+
+    print("[PASS] --jobs validation test passed")
+
+def main():
+    """Run all tests"""
+    print("Running Trisonica data visualizer tests...\n")
+
+    try:
+        test_csv_stray_value_late_in_file()
+        test_tagged_log_parsing()
+        test_json_log_parsing()
+        test_streamed_statistics_match_full_load()
+        test_wind_rose_bins()
+        test_plots_with_no_rows()
+        test_format_cache()
+        test_jobs_must_be_positive()
+
+        print("\nAll tests passed!")
+
+    except Exception as e:
+        print(f"\n[FAIL] Test failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()